@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Event loop benchmark for requests-async
+
+Measures request throughput against a local HTTP server on the stdlib
+asyncio loop and on uvloop (when installed), and across several loops
+sharing one SessionRegistry.
+
+Usage:
+    python examples/loop_benchmark.py [requests] [concurrency]
+"""
+
+import asyncio
+import sys
+import threading
+import time
+
+sys.path.insert(0, '.')
+
+import requests_async
+from requests_async import loops
+
+RESPONSE = b"HTTP/1.1 200 OK\r\nContent-Length: 2\r\nContent-Type: text/plain\r\n\r\nok"
+
+
+async def _handle(reader, writer):
+    try:
+        while True:
+            head = await reader.readuntil(b"\r\n\r\n")
+            if not head:
+                break
+            writer.write(RESPONSE)
+            await writer.drain()
+    except (asyncio.IncompleteReadError, ConnectionResetError):
+        pass
+    finally:
+        writer.close()
+
+
+def start_server():
+    """Start a keep-alive HTTP server on a background thread; return its URL"""
+    loop = asyncio.new_event_loop()
+    server = loop.run_until_complete(asyncio.start_server(_handle, '127.0.0.1', 0))
+    port = server.sockets[0].getsockname()[1]
+    threading.Thread(target=loop.run_forever, daemon=True).start()
+    return f'http://127.0.0.1:{port}/'
+
+
+async def hammer(session, url, total, concurrency):
+    """Send ``total`` GET requests with at most ``concurrency`` in flight"""
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one():
+        async with semaphore:
+            await session.get(url)
+
+    await asyncio.gather(*(one() for _ in range(total)))
+
+
+def bench_single_loop(url, total, concurrency, use_uvloop):
+    async def main():
+        async with requests_async.AsyncSession() as session:
+            await hammer(session, url, concurrency, concurrency)  # warm up the pool
+            start = time.perf_counter()
+            await hammer(session, url, total, concurrency)
+            return time.perf_counter() - start
+
+    return total / loops.run(main(), use_uvloop=use_uvloop)
+
+
+def bench_multi_loop(url, total, concurrency, loop_count):
+    registry = requests_async.SessionRegistry()
+
+    async def main():
+        session = await registry.get()
+        await hammer(session, url, total // loop_count, concurrency)
+
+    def worker():
+        asyncio.run(main())
+
+    threads = [threading.Thread(target=worker) for _ in range(loop_count)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return total / (time.perf_counter() - start)
+
+
+def main():
+    total = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    concurrency = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+    url = start_server()
+
+    print(f"requests={total} concurrency={concurrency}")
+    print(f"  asyncio loop:        {bench_single_loop(url, total, concurrency, False):8.0f} req/s")
+    if loops.uvloop_available():
+        print(f"  uvloop:              {bench_single_loop(url, total, concurrency, True):8.0f} req/s")
+    else:
+        print("  uvloop:              not installed (pip install requests-async[uvloop])")
+    print(f"  4 loops + registry:  {bench_multi_loop(url, total, concurrency, 4):8.0f} req/s")
+
+
+if __name__ == '__main__':
+    main()
@@ -15,16 +15,89 @@ Basic usage:
 __version__ = "0.2.4"
 __author__ = "requests-async contributors"
 
-from .client import (
-    AsyncSession,
-    get, post, put, delete, patch, head, options, request
-)
+import importlib
+from typing import TYPE_CHECKING
+
+# Public names are resolved on first attribute access, so `import requests_async`
+# does not pay for httpx, ssl or multiprocessing until they are actually used.
+_LAZY_ATTRS = {
+    'AsyncSession': '.client',
+    'get': '.client', 'post': '.client', 'put': '.client', 'delete': '.client',
+    'patch': '.client', 'head': '.client', 'options': '.client', 'request': '.client',
+    'PaginationStrategy': '.pagination', 'LinkHeaderPagination': '.pagination',
+    'CursorPagination': '.pagination', 'OffsetPagination': '.pagination',
+    'PageNumberPagination': '.pagination',
+    'RequestScheduler': '.scheduler', 'DeadlineExceeded': '.scheduler',
+    'RateLimiter': '.ratelimit', 'SharedRateLimiter': '.ratelimit',
+    'QuotaBackend': '.quota', 'LocalQuotaBackend': '.quota',
+    'SharedMemoryQuotaBackend': '.quota', 'FileLockQuotaBackend': '.quota',
+    'RedisQuotaBackend': '.quota',
+    'ResultSink': '.sinks', 'JSONLSink': '.sinks', 'DirectorySink': '.sinks',
+    'ParquetSink': '.sinks', 'FetchResult': '.sinks',
+    'ProcessExecutor': '.executor',
+    'SessionRegistry': '.loops', 'install_uvloop': '.loops', 'uvloop_available': '.loops',
+    'get_ssl_context': '.tls', 'clear_ssl_context_cache': '.tls',
+    'RequestTemplate': '.template', 'LightResponse': '.lightweight',
+    'PoolAutoTuner': '.pool',
+    # Expose httpx types for convenience
+    'Response': 'httpx', 'HTTPError': 'httpx', 'RequestError': 'httpx',
+    'TimeoutException': 'httpx',
+}
+_LAZY_SUBMODULES = {'loops', 'sync'}
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .client import (
+        AsyncSession,
+        get, post, put, delete, patch, head, options, request
+    )
+    from .pagination import (
+        PaginationStrategy, LinkHeaderPagination, CursorPagination,
+        OffsetPagination, PageNumberPagination
+    )
+    from .scheduler import RequestScheduler, DeadlineExceeded
+    from .ratelimit import RateLimiter, SharedRateLimiter
+    from .quota import (
+        QuotaBackend, LocalQuotaBackend, SharedMemoryQuotaBackend,
+        FileLockQuotaBackend, RedisQuotaBackend
+    )
+    from .executor import ProcessExecutor
+    from .loops import SessionRegistry, install_uvloop, uvloop_available
+    from .tls import get_ssl_context, clear_ssl_context_cache
+    from .template import RequestTemplate
+    from .lightweight import LightResponse
+    from .pool import PoolAutoTuner
+    from .sinks import ResultSink, JSONLSink, DirectorySink, ParquetSink, FetchResult
+    from . import loops, sync
+    from httpx import Response, HTTPError, RequestError, TimeoutException
+
+
+def __getattr__(name):
+    if name in _LAZY_SUBMODULES:
+        return importlib.import_module(f'.{name}', __name__)
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
 
-# Expose httpx types for convenience
-from httpx import Response, HTTPError, RequestError, TimeoutException
 
 __all__ = [
     'AsyncSession',
     'get', 'post', 'put', 'delete', 'patch', 'head', 'options', 'request',
+    'PaginationStrategy', 'LinkHeaderPagination', 'CursorPagination',
+    'OffsetPagination', 'PageNumberPagination',
+    'RequestScheduler', 'DeadlineExceeded', 'sync',
+    'RateLimiter', 'SharedRateLimiter', 'ProcessExecutor',
+    'QuotaBackend', 'LocalQuotaBackend', 'SharedMemoryQuotaBackend',
+    'FileLockQuotaBackend', 'RedisQuotaBackend',
+    'ResultSink', 'JSONLSink', 'DirectorySink', 'ParquetSink', 'FetchResult',
+    'SessionRegistry', 'install_uvloop', 'uvloop_available', 'loops',
+    'get_ssl_context', 'clear_ssl_context_cache', 'RequestTemplate', 'LightResponse',
+    'PoolAutoTuner',
     'Response', 'HTTPError', 'RequestError', 'TimeoutException'
 ]
\ No newline at end of file
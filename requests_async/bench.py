@@ -0,0 +1,263 @@
+"""
+Load generator for capacity testing
+
+Usage:
+    python -m requests_async.bench http://127.0.0.1:8000/ -c 50 -n 10000
+    python -m requests_async.bench http://127.0.0.1:8000/ --rate 500 --duration 30 --json
+    python -m requests_async.bench --requests-file requests.jsonl -c 20 -d 60
+
+Closed-loop mode (``-c``) keeps a fixed number of requests in flight. Open-loop
+mode (``--rate``) sends on a fixed arrival schedule whether or not earlier
+requests have finished, and measures latency from each request's scheduled
+start time, so a stalled server cannot hide queueing delay (coordinated
+omission).
+
+A requests file holds either JSON lines (``{"method": ..., "url": ...,
+"headers": {...}, "body": "..."}``) or plain ``METHOD URL`` / ``URL`` lines;
+entries are sent round-robin.
+"""
+
+import argparse
+import asyncio
+import itertools
+import json
+import math
+import sys
+import time
+from collections import Counter
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+
+import httpx
+
+from .client import AsyncSession
+
+Target = Dict[str, Any]
+
+
+def load_requests(path: str) -> List[Target]:
+    """Parse a requests file into a list of target dicts"""
+    targets = []
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+            if line.startswith('{'):
+                entry = json.loads(line)
+                targets.append({
+                    'method': entry.get('method', 'GET').upper(),
+                    'url': entry['url'],
+                    'headers': entry.get('headers'),
+                    'content': entry.get('body'),
+                })
+            else:
+                parts = line.split(None, 1)
+                method, url = parts if len(parts) == 2 else ('GET', parts[0])
+                targets.append({'method': method.upper(), 'url': url,
+                                'headers': None, 'content': None})
+    if not targets:
+        raise ValueError(f"No requests found in {path}")
+    return targets
+
+
+def percentile(sorted_values: Sequence[float], pct: float) -> float:
+    """Nearest-rank percentile of already sorted values"""
+    if not sorted_values:
+        return 0.0
+    rank = max(math.ceil(pct / 100.0 * len(sorted_values)) - 1, 0)
+    return sorted_values[min(rank, len(sorted_values) - 1)]
+
+
+class BenchResult:
+    """Latencies, status codes and errors collected during a run"""
+
+    def __init__(self, mode: str):
+        self.mode = mode
+        self.latencies: List[float] = []
+        self.statuses: Counter = Counter()
+        self.errors: Counter = Counter()
+        self.elapsed = 0.0
+
+    def record(self, latency: float, status: Optional[int] = None,
+               error: Optional[BaseException] = None) -> None:
+        self.latencies.append(latency)
+        if error is not None:
+            self.errors[type(error).__name__] += 1
+        else:
+            self.statuses[status] += 1
+
+    def summary(self) -> Dict[str, Any]:
+        """Return the report as a JSON-serialisable dict (latencies in milliseconds)"""
+        latencies = sorted(self.latencies)
+        total = len(latencies)
+        ms = 1000.0
+        return {
+            'mode': self.mode,
+            'requests': total,
+            'duration': round(self.elapsed, 3),
+            'throughput': round(total / self.elapsed, 2) if self.elapsed else 0.0,
+            'latency_ms': {
+                'min': round(latencies[0] * ms, 3) if latencies else 0.0,
+                'mean': round(sum(latencies) / total * ms, 3) if total else 0.0,
+                'p50': round(percentile(latencies, 50) * ms, 3),
+                'p90': round(percentile(latencies, 90) * ms, 3),
+                'p99': round(percentile(latencies, 99) * ms, 3),
+                'p999': round(percentile(latencies, 99.9) * ms, 3),
+                'max': round(latencies[-1] * ms, 3) if latencies else 0.0,
+            },
+            'status_codes': {str(code): count for code, count in sorted(self.statuses.items())},
+            'errors': dict(self.errors),
+        }
+
+    def format_text(self) -> str:
+        """Return the report as human-readable text"""
+        s = self.summary()
+        lat = s['latency_ms']
+        lines = [
+            f"Mode:        {s['mode']}",
+            f"Requests:    {s['requests']} in {s['duration']:.2f}s",
+            f"Throughput:  {s['throughput']:.1f} req/s",
+            "Latency (ms):",
+            f"  min {lat['min']:.2f}  mean {lat['mean']:.2f}  max {lat['max']:.2f}",
+            f"  p50 {lat['p50']:.2f}  p90 {lat['p90']:.2f}  "
+            f"p99 {lat['p99']:.2f}  p99.9 {lat['p999']:.2f}",
+            "Status codes:",
+        ]
+        lines += [f"  {code}: {count}" for code, count in s['status_codes'].items()] or ["  (none)"]
+        if s['errors']:
+            lines.append("Errors:")
+            lines += [f"  {name}: {count}" for name, count in s['errors'].items()]
+        return '\n'.join(lines)
+
+
+async def _send(session: AsyncSession, target: Target, result: BenchResult,
+                started: float) -> None:
+    try:
+        response = await session.request(target['method'], target['url'],
+                                         headers=target.get('headers'),
+                                         content=target.get('content'))
+    except Exception as exc:
+        result.record(time.perf_counter() - started, error=exc)
+    else:
+        result.record(time.perf_counter() - started, status=response.status_code)
+
+
+async def run_closed_loop(session: AsyncSession, targets: Sequence[Target],
+                          concurrency: int, total: Optional[int] = None,
+                          duration: Optional[float] = None) -> BenchResult:
+    """Keep ``concurrency`` requests in flight until ``total`` or ``duration`` is reached"""
+    result = BenchResult(f'closed-loop, concurrency={concurrency}')
+    cycle: Iterator[Target] = itertools.cycle(targets)
+    counter = itertools.count()
+    start = time.perf_counter()
+    stop_at = start + duration if duration else None
+
+    async def worker() -> None:
+        while True:
+            if total is not None and next(counter) >= total:
+                return
+            if stop_at is not None and time.perf_counter() >= stop_at:
+                return
+            await _send(session, next(cycle), result, time.perf_counter())
+
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    result.elapsed = time.perf_counter() - start
+    return result
+
+
+async def run_open_loop(session: AsyncSession, targets: Sequence[Target],
+                        rate: float, total: Optional[int] = None,
+                        duration: Optional[float] = None) -> BenchResult:
+    """Start requests at ``rate`` per second regardless of completions"""
+    result = BenchResult(f'open-loop, rate={rate:g}/s')
+    if total is None:
+        total = int(rate * duration)
+    interval = 1.0 / rate
+    cycle: Iterator[Target] = itertools.cycle(targets)
+    tasks = []
+    start = time.perf_counter()
+    for i in range(total):
+        scheduled = start + i * interval
+        delay = scheduled - time.perf_counter()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        # Latency counts from the scheduled start, not the actual send time
+        tasks.append(asyncio.ensure_future(_send(session, next(cycle), result, scheduled)))
+    await asyncio.gather(*tasks)
+    result.elapsed = time.perf_counter() - start
+    return result
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog='python -m requests_async.bench',
+        description='HTTP load generator built on requests_async.AsyncSession',
+    )
+    parser.add_argument('url', nargs='?', help='Target URL (or use --requests-file)')
+    parser.add_argument('-f', '--requests-file', help='JSONL or "METHOD URL" lines to replay')
+    parser.add_argument('-X', '--method', default='GET', help='HTTP method for URL mode')
+    parser.add_argument('-H', '--header', action='append', default=[],
+                        help='Header "Name: value" (repeatable)')
+    parser.add_argument('--data', help='Request body for URL mode')
+    parser.add_argument('-c', '--concurrency', type=int, default=10,
+                        help='Requests in flight (closed loop; default: 10)')
+    parser.add_argument('-r', '--rate', type=float,
+                        help='Arrival rate in requests/second (open loop)')
+    parser.add_argument('-n', '--requests', type=int, help='Total requests to send')
+    parser.add_argument('-d', '--duration', type=float, help='Run time in seconds')
+    parser.add_argument('--warmup', type=int, default=0,
+                        help='Requests sent before measuring (default: 0)')
+    parser.add_argument('--timeout', type=float, default=30.0, help='Request timeout (default: 30)')
+    parser.add_argument('--http2', action='store_true', help='Enable HTTP/2 (needs h2)')
+    parser.add_argument('-k', '--insecure', action='store_true', help='Skip TLS verification')
+    parser.add_argument('--json', action='store_true', help='Print the report as JSON')
+    return parser
+
+
+async def run(args: argparse.Namespace) -> BenchResult:
+    """Run a benchmark described by parsed command-line arguments"""
+    if args.requests_file:
+        targets = load_requests(args.requests_file)
+    else:
+        headers = {}
+        for header in args.header:
+            name, _, value = header.partition(':')
+            headers[name.strip()] = value.strip()
+        targets = [{'method': args.method.upper(), 'url': args.url, 'headers': headers or None,
+                    'content': args.data.encode() if args.data else None}]
+
+    total = args.requests
+    if total is None and args.duration is None:
+        total = 1000
+    connections = max(args.concurrency, 1)
+    session_kwargs = {
+        'timeout': args.timeout,
+        'http2': args.http2,
+        'verify': not args.insecure,
+    }
+    if args.rate is None:
+        session_kwargs['limits'] = httpx.Limits(max_connections=connections,
+                                                max_keepalive_connections=connections)
+
+    async with AsyncSession(**session_kwargs) as session:
+        if args.warmup:
+            await run_closed_loop(session, targets, connections, total=args.warmup)
+        if args.rate is not None:
+            return await run_open_loop(session, targets, args.rate, total, args.duration)
+        return await run_closed_loop(session, targets, connections, total, args.duration)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if not args.url and not args.requests_file:
+        parser.error('a URL or --requests-file is required')
+    if args.rate is not None and args.rate <= 0:
+        parser.error('--rate must be positive')
+    result = asyncio.run(run(args))
+    print(json.dumps(result.summary(), indent=2) if args.json else result.format_text())
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -2,8 +2,20 @@
 Async HTTP client implementation based on httpx
 """
 
+import asyncio
+import ssl
+import time
 import httpx
-from typing import Optional, Dict, Any, Union
+from typing import Optional, Dict, Any, Union, AsyncIterator, Awaitable, Callable, Iterable
+
+from .pagination import PaginationStrategy, get_strategy, paginate as _paginate
+from .pool import PoolAutoTuner, PoolMonitor, get_pools, pool_stats as _pool_stats
+from .lightweight import DEFAULT_KEEP_HEADERS, LightResponse
+from .ratelimit import RateLimiter
+from .scheduler import DeadlineExceeded, RequestScheduler
+from .sinks import Checkpoint, ResultSink, fetch_many as _fetch_many
+from .template import RequestTemplate
+from .tls import get_ssl_context
 
 # Re-export httpx.Response for convenience
 Response = httpx.Response
@@ -23,6 +35,13 @@ class AsyncSession:
                  timeout: Optional[float] = 30.0,
                  headers: Optional[Dict[str, str]] = None,
                  proxies: Optional[Union[str, Dict[str, str]]] = None,
+                 max_concurrency: Optional[int] = None,
+                 rate_limit: Optional[Union[float, RateLimiter]] = None,
+                 ciphers: Optional[str] = None,
+                 lightweight: bool = False,
+                 keep_headers: Iterable[str] = DEFAULT_KEEP_HEADERS,
+                 pool_metrics: bool = False,
+                 auto_tune: Union[bool, PoolAutoTuner] = False,
                  **kwargs):
         """
         Initialize async session
@@ -33,6 +52,17 @@ class AsyncSession:
             proxies: Proxy configuration (string or dict)
                     - String: "http://proxy:port" or "socks5://proxy:port"
                     - Dict: {"http://": "http://proxy:port", "https://": "https://proxy:port"}
+            max_concurrency: Limit on in-flight requests; excess requests wait in a
+                    priority queue (see ``priority=`` and ``deadline=`` on requests)
+            rate_limit: Requests per second, or a RateLimiter instance
+            ciphers: OpenSSL cipher string for the shared SSL context
+            lightweight: Return compact LightResponse objects instead of httpx.Response
+            keep_headers: Header names retained on LightResponse (default: content-type)
+            pool_metrics: Track pool wait, upstream latency and connection reuse per
+                    origin for ``pool_stats()``
+            auto_tune: Resize the pool's ``max_connections`` and keepalive limits from
+                    observed pool wait and latency; True or a PoolAutoTuner
+                    (implies ``pool_metrics``)
             **kwargs: Additional httpx.AsyncClient arguments
         """
         # Handle proxy configuration
@@ -57,31 +87,206 @@ class AsyncSession:
                     # Use single proxy for all protocols (most common use case)
                     kwargs['proxy'] = proxy_url
         
+        # Share one SSL context per verify/cert/cipher combination across the
+        # process instead of loading CA bundles for every client
+        verify = kwargs.get('verify', True)
+        if not isinstance(verify, ssl.SSLContext):
+            kwargs['verify'] = get_ssl_context(
+                verify, kwargs.pop('cert', None),
+                trust_env=kwargs.get('trust_env', True),
+                http2=kwargs.get('http2', False),
+                ciphers=ciphers,
+            )
+        
+        if auto_tune is True:
+            auto_tune = PoolAutoTuner()
+        self.pool_monitor: Optional[PoolMonitor] = None
+        if pool_metrics or auto_tune:
+            self.pool_monitor = PoolMonitor(tuner=auto_tune or None)
+            event_hooks = {name: list(hooks)
+                           for name, hooks in (kwargs.get('event_hooks') or {}).items()}
+            # Run last so the measured pool wait starts right before the transport
+            event_hooks.setdefault('request', []).append(self.pool_monitor.on_request)
+            kwargs['event_hooks'] = event_hooks
+        
         self._client_kwargs = {
             'timeout': timeout,
             'headers': headers,
             **kwargs
         }
         self._client: Optional[httpx.AsyncClient] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self.scheduler: Optional[RequestScheduler] = (
+            RequestScheduler(max_concurrency) if max_concurrency else None
+        )
+        if rate_limit is not None and not isinstance(rate_limit, RateLimiter):
+            rate_limit = RateLimiter(rate_limit)
+        self.rate_limiter: Optional[RateLimiter] = rate_limit
+        self.lightweight = lightweight
+        self.keep_headers = tuple(name.lower() for name in keep_headers)
     
     async def __aenter__(self):
         self._client = httpx.AsyncClient(**self._client_kwargs)
+        self._loop = asyncio.get_running_loop()
+        if self.pool_monitor is not None:
+            self.pool_monitor.attach(self._client)
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         if self._client:
             await self._client.aclose()
     
-    async def request(self, method: str, url: str, **kwargs) -> Response:
-        """Send HTTP request"""
-        if not self._client:
-            raise RuntimeError("Session not initialized. Use 'async with' statement.")
+    async def request(self, method: str, url: str,
+                      priority: int = 0,
+                      deadline: Optional[float] = None,
+                      lightweight: Optional[bool] = None,
+                      **kwargs) -> Union[Response, LightResponse]:
+        """
+        Send HTTP request
+        
+        Args:
+            priority: Queue priority when ``max_concurrency`` is set; higher runs first
+            deadline: Seconds the request may wait before dispatch; once expired it
+                      is dropped with DeadlineExceeded instead of being sent
+            lightweight: Override the session's ``lightweight`` setting for this request
+        """
+        self._require_client()
         
         # Handle requests -> httpx parameter mapping
         if 'allow_redirects' in kwargs:
             kwargs['follow_redirects'] = kwargs.pop('allow_redirects')
         
-        return await self._client.request(method, url, **kwargs)
+        return await self._dispatch(
+            lambda: self._client.request(method, url, **kwargs), priority, deadline,
+            lightweight,
+        )
+    
+    def prepare(self, method: str, url_template: str,
+                headers: Optional[Dict[str, str]] = None,
+                params: Optional[Dict[str, Any]] = None,
+                **kwargs) -> RequestTemplate:
+        """
+        Precompile a request shape that is sent many times
+        
+        Session headers, params, base URL and timeout are merged once; each
+        ``send`` only fills in ``{field}`` placeholders and per-call extras.
+        
+        Args:
+            method: HTTP method
+            url_template: URL or path, optionally with ``{field}`` placeholders
+            headers: Headers added to the session headers
+            params: Query parameters added to the session params
+            **kwargs: ``timeout`` and ``follow_redirects``/``allow_redirects``
+        
+        Example:
+            get_user = session.prepare('GET', '/users/{user_id}')
+            response = await get_user.send({'user_id': 42}, params={'fields': 'name'})
+        """
+        if 'allow_redirects' in kwargs:
+            kwargs['follow_redirects'] = kwargs.pop('allow_redirects')
+        return RequestTemplate(self, method, url_template, headers=headers, params=params,
+                               **kwargs)
+    
+    async def fetch_many(self, urls: Iterable[str], sink: ResultSink,
+                         method: str = 'GET',
+                         concurrency: int = 20,
+                         batch_size: int = 100,
+                         flush_interval: float = 1.0,
+                         buffer_size: Optional[int] = None,
+                         checkpoint: Union[str, Checkpoint, None] = None,
+                         **kwargs) -> Dict[str, int]:
+        """
+        Fetch many URLs and stream the results into a sink as they complete
+        
+        Results are buffered in a bounded queue and written in batches from a
+        worker thread; when the sink falls behind, fetchers wait. Responses are
+        fetched in lightweight mode and dropped once written.
+        
+        Args:
+            urls: URLs to fetch; consumed lazily
+            sink: JSONLSink, DirectorySink, ParquetSink or another ResultSink
+            method: HTTP method used for every request (default: GET)
+            concurrency: Number of concurrent fetchers (default: 20)
+            batch_size: Results per sink write (default: 100)
+            flush_interval: Maximum seconds a partial batch waits (default: 1.0)
+            buffer_size: Queue capacity before fetchers block (default: 2 * batch_size)
+            checkpoint: Path or Checkpoint of completed URLs; existing entries are
+                        skipped so an interrupted run can be resumed. Transport
+                        errors and retryable statuses are not recorded
+            **kwargs: Request arguments applied to every request
+        
+        Returns:
+            Counts of fetched, errors, skipped (from the checkpoint) and written results
+        """
+        return await _fetch_many(self, urls, sink, method=method, concurrency=concurrency,
+                                 batch_size=batch_size, flush_interval=flush_interval,
+                                 buffer_size=buffer_size, checkpoint=checkpoint, **kwargs)
+    
+    def _require_client(self) -> httpx.AsyncClient:
+        if not self._client:
+            raise RuntimeError("Session not initialized. Use 'async with' statement.")
+        if asyncio.get_running_loop() is not self._loop:
+            raise RuntimeError(
+                "Session is bound to a different event loop; "
+                "use requests_async.SessionRegistry for one session per loop."
+            )
+        return self._client
+    
+    async def _dispatch(self, send: Callable[[], Awaitable[Response]],
+                        priority: int = 0,
+                        deadline: Optional[float] = None,
+                        lightweight: Optional[bool] = None) -> Union[Response, LightResponse]:
+        """Run ``send`` through the scheduler and rate limiter"""
+        expires = time.monotonic() + deadline if deadline is not None else None
+        if self.scheduler is None:
+            if deadline is not None and deadline <= 0:
+                raise DeadlineExceeded()
+            response = await self._send(send, expires)
+        else:
+            await self.scheduler.acquire(priority, expires)
+            try:
+                response = await self._send(send, expires)
+            finally:
+                self.scheduler.release()
+        
+        if self.lightweight if lightweight is None else lightweight:
+            return LightResponse.from_response(response, self.keep_headers)
+        return response
+    
+    async def _send(self, send: Callable[[], Awaitable[Response]],
+                    expires: Optional[float] = None) -> Response:
+        if self.rate_limiter is not None:
+            await self.rate_limiter.acquire()
+            # The deadline covers the rate-limit wait too
+            if expires is not None and time.monotonic() >= expires:
+                raise DeadlineExceeded()
+        return await send()
+    
+    def queue_stats(self) -> Optional[Dict[str, Any]]:
+        """Return scheduler queue statistics, or None when ``max_concurrency`` is unset"""
+        return self.scheduler.stats() if self.scheduler else None
+    
+    def pool_stats(self) -> Dict[str, Any]:
+        """
+        Report connection pool state, to tell pool exhaustion from slow upstreams
+        
+        Always includes ``limits``, ``queued`` (requests waiting for a connection)
+        and per-origin ``active``/``idle`` connection counts. With ``pool_metrics``
+        or ``auto_tune``, origins and the totals also carry ``requests``,
+        ``reuse_ratio``, ``avg_wait``/``p95_wait``/``max_wait`` (time spent waiting
+        for a connection) and ``avg_latency`` (request sent to response headers),
+        all in seconds, plus ``tuning`` state.
+        
+        Example:
+            stats = session.pool_stats()
+            if stats['p95_wait'] > stats['avg_latency']:
+                print('pool exhausted; raise max_connections')
+        """
+        if not self._client:
+            raise RuntimeError("Session not initialized. Use 'async with' statement.")
+        if self.pool_monitor is not None:
+            return self.pool_monitor.stats()
+        return _pool_stats(get_pools(self._client))
     
     async def get(self, url: str, **kwargs) -> Response:
         """Send GET request"""
@@ -110,9 +315,41 @@ class AsyncSession:
     async def options(self, url: str, **kwargs) -> Response:
         """Send OPTIONS request"""
         return await self.request('OPTIONS', url, **kwargs)
+    
+    def paginate(self, url: str,
+                 strategy: Union[str, PaginationStrategy] = 'link',
+                 method: str = 'GET',
+                 prefetch: int = 1,
+                 max_pages: Optional[int] = None,
+                 **kwargs) -> AsyncIterator[Any]:
+        """
+        Iterate over the items of a paginated API
+        
+        Args:
+            url: URL of the first page
+            strategy: 'link', 'cursor', 'offset', 'page' or a PaginationStrategy instance
+            method: HTTP method used for every page (default: GET)
+            prefetch: Pages to request ahead of the consumer when the strategy
+                      allows computing page URLs up front (offset/page)
+            max_pages: Stop after this many pages
+            **kwargs: Request arguments applied to every page
+        
+        Example:
+            async for user in session.paginate(url, strategy=OffsetPagination(limit=50)):
+                print(user)
+        """
+        return _paginate(self, method, url, get_strategy(strategy),
+                         prefetch=prefetch, max_pages=max_pages, **kwargs)
 
 
 # Global convenience functions
+
+# Session parameters that should go to AsyncSession
+_SESSION_PARAM_NAMES = frozenset({
+    'timeout', 'headers', 'proxies', 'proxy', 'verify', 'cert', 'trust_env', 'ciphers'
+})
+
+
 async def request(method: str, url: str, **kwargs) -> Response:
     """
     Send HTTP request using temporary session
@@ -124,11 +361,8 @@ async def request(method: str, url: str, **kwargs) -> Response:
     session_params = {}
     request_params = {}
     
-    # Session parameters that should go to AsyncSession
-    session_param_names = {'timeout', 'headers', 'proxies', 'proxy', 'verify', 'cert', 'trust_env'}
-    
     for key, value in kwargs.items():
-        if key in session_param_names:
+        if key in _SESSION_PARAM_NAMES:
             session_params[key] = value
         else:
             request_params[key] = value
@@ -0,0 +1,352 @@
+"""
+Multi-process fan-out executor
+
+Each worker process runs its own event loop and AsyncSession. Jobs are sent
+to workers in batches and results come back as pickled batches, so TLS,
+decompression and response parsing (via ``handler``) scale across cores.
+
+Example:
+    def parse(response):
+        return response.json()['id']
+
+    with ProcessExecutor(workers=4, max_concurrency=200, rate_limit=500) as pool:
+        for item in pool.map('GET', urls, handler=parse):
+            print(item)
+"""
+
+import asyncio
+import itertools
+import math
+import multiprocessing
+import os
+import pickle
+import queue
+import threading
+from collections import deque
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from .client import AsyncSession
+from .loops import run as _run_loop
+from .quota import LocalQuotaBackend
+from .ratelimit import RateLimiter, SharedRateLimiter
+
+_FLUSH_INTERVAL = 0.05
+# Runs abandoned by the parent are recorded at ``run_id % _CANCEL_SLOTS``
+_CANCEL_SLOTS = 64
+
+
+class WorkerError(Exception):
+    """Stands in for a worker-side result or exception that could not be sent back"""
+
+
+def _portable(value: Any) -> Any:
+    """Return ``value`` if it survives a pickle round trip, else a WorkerError"""
+    try:
+        pickle.loads(pickle.dumps(value, pickle.HIGHEST_PROTOCOL))
+        return value
+    except Exception as exc:
+        if isinstance(value, BaseException):
+            # e.g. httpx.HTTPStatusError, whose keyword-only arguments break unpickling
+            return WorkerError(f"{type(value).__name__}: {value}")
+        return WorkerError(f"Unpicklable result {value!r}: {exc}")
+
+
+def _dump_results(results: List[Tuple[int, bool, Any]]) -> bytes:
+    # Exceptions are the values known to pickle yet fail to load, so only they
+    # pay for a round trip; responses and handler results are dumped once
+    checked = []
+    for index, ok, value in results:
+        if isinstance(value, BaseException):
+            portable = _portable(value)
+            ok, value = ok and portable is value, portable
+        checked.append((index, ok, value))
+    try:
+        return pickle.dumps(checked, pickle.HIGHEST_PROTOCOL)
+    except Exception:
+        safe = []
+        for index, ok, value in checked:
+            portable = _portable(value)
+            safe.append((index, ok and portable is value, portable))
+        return pickle.dumps(safe, pickle.HIGHEST_PROTOCOL)
+
+
+async def _worker_main(jobs, results, cancelled, concurrency: int, rate_limiter,
+                       session_kwargs: Dict[str, Any], batch_size: int) -> None:
+    loop = asyncio.get_running_loop()
+    buffer: Dict[int, List[Tuple[int, bool, Any]]] = {}
+    pending = set()
+
+    def flush() -> None:
+        for run_id, items in list(buffer.items()):
+            if items:
+                results.put((run_id, _dump_results(items)))
+        buffer.clear()
+
+    async def periodic_flush() -> None:
+        while True:
+            await asyncio.sleep(_FLUSH_INTERVAL)
+            flush()
+
+    def is_cancelled(run_id: int) -> bool:
+        return cancelled[run_id % _CANCEL_SLOTS] == run_id
+
+    async def run(session, run_id, handler, index, method, url, kwargs) -> None:
+        if is_cancelled(run_id):
+            return
+        try:
+            value = await session.request(method, url, **kwargs)
+            if handler is not None:
+                value = handler(value)
+            item = (index, True, value)
+        except Exception as exc:
+            item = (index, False, exc)
+        items = buffer.setdefault(run_id, [])
+        items.append(item)
+        if len(items) >= batch_size:
+            flush()
+
+    flusher = asyncio.ensure_future(periodic_flush())
+    async with AsyncSession(max_concurrency=concurrency, rate_limit=rate_limiter,
+                            **session_kwargs) as session:
+        while True:
+            # Keep only a bounded backlog locally; the rest stays in the shared queue
+            while len(pending) >= concurrency * 2:
+                _, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            batch = await loop.run_in_executor(None, jobs.get)
+            if batch is None:
+                break
+            run_id, handler, items = batch
+            if is_cancelled(run_id):
+                continue
+            for index, method, url, kwargs in items:
+                pending.add(asyncio.ensure_future(
+                    run(session, run_id, handler, index, method, url, kwargs)
+                ))
+        if pending:
+            await asyncio.wait(pending)
+    flusher.cancel()
+    flush()
+
+
+def _worker(jobs, results, cancelled, concurrency, rate_limiter, session_kwargs, batch_size,
+            use_uvloop) -> None:
+    _run_loop(_worker_main(jobs, results, cancelled, concurrency, rate_limiter,
+                           session_kwargs, batch_size), use_uvloop=use_uvloop)
+
+
+class ProcessExecutor:
+    """
+    Shard requests across worker processes, each with its own AsyncSession
+
+    Args:
+        workers: Number of worker processes (default: os.cpu_count())
+        max_concurrency: Total in-flight requests, split evenly across workers
+        rate_limit: Total requests per second, enforced through one bucket in
+                    shared memory, or a RateLimiter with a cross-process backend
+        lease_size: Tokens each worker takes from the shared bucket at a time when
+                    ``rate_limit`` is a number (default: ``max(1, int(rate * 0.05))``)
+        batch_size: Jobs per IPC message in each direction
+        mp_context: multiprocessing context or start method name
+        use_uvloop: Run each worker's loop on uvloop when installed
+        **session_kwargs: AsyncSession arguments for every worker; must be picklable
+    """
+
+    def __init__(self, workers: Optional[int] = None,
+                 max_concurrency: int = 100,
+                 rate_limit: Optional[Union[float, RateLimiter]] = None,
+                 lease_size: Optional[int] = None,
+                 batch_size: int = 64,
+                 mp_context=None,
+                 use_uvloop: bool = False,
+                 **session_kwargs):
+        if isinstance(mp_context, str) or mp_context is None:
+            mp_context = multiprocessing.get_context(mp_context)
+        self.workers = workers or os.cpu_count() or 1
+        self.batch_size = batch_size
+        self._context = mp_context
+        self._concurrency = max(1, math.ceil(max_concurrency / self.workers))
+        if isinstance(rate_limit, RateLimiter):
+            if isinstance(rate_limit.backend, LocalQuotaBackend):
+                # Each worker would get its own copy of the bucket: workers x rate
+                raise ValueError(
+                    "rate_limit must share its bucket across processes; pass a rate, "
+                    "a SharedRateLimiter or a RateLimiter with a shared QuotaBackend"
+                )
+        elif rate_limit is not None:
+            rate_limit = SharedRateLimiter(rate_limit, context=mp_context,
+                                           lease_size=lease_size)
+        self._rate_limiter = rate_limit
+        self._session_kwargs = session_kwargs
+        self._use_uvloop = use_uvloop
+        self._jobs = None
+        self._results = None
+        self._cancelled = None
+        self._processes: List[multiprocessing.Process] = []
+        self._run_ids = itertools.count()
+        # Result batches read for another active run wait here for their owner
+        self._routed: Dict[int, deque] = {}
+        self._results_lock = threading.Lock()
+
+    def start(self) -> None:
+        """Start the worker processes (called automatically on first use)"""
+        if self._processes:
+            return
+        self._jobs = self._context.Queue(maxsize=self.workers * 4)
+        self._results = self._context.Queue()
+        self._cancelled = self._context.Array('q', [-1] * _CANCEL_SLOTS)
+        for _ in range(self.workers):
+            process = self._context.Process(
+                target=_worker,
+                args=(self._jobs, self._results, self._cancelled, self._concurrency,
+                      self._rate_limiter,
+                      self._session_kwargs, self.batch_size, self._use_uvloop),
+                daemon=True,
+            )
+            process.start()
+            self._processes.append(process)
+
+    def as_completed(self, method: str, urls: Iterable[str],
+                     handler: Optional[Callable[[Any], Any]] = None,
+                     return_exceptions: bool = False,
+                     **kwargs) -> Iterator[Tuple[int, Any]]:
+        """
+        Yield ``(index, result)`` pairs in completion order
+
+        Args:
+            method: HTTP method used for every request
+            urls: URLs to request; consumed lazily
+            handler: Picklable callable applied to each response inside the
+                     worker; its return value is sent back instead of the response
+            return_exceptions: Yield exceptions as results instead of raising
+            **kwargs: Request arguments applied to every request; must be picklable
+
+        If iteration stops early (an exception is raised, or the caller stops
+        consuming), the remaining URLs are not submitted and workers skip the
+        jobs of this run they have not started yet.
+
+        Several runs may be active at once (interleaved generators, nested
+        calls or other threads); each receives only its own results.
+        """
+        self.start()
+        run_id = next(self._run_ids)
+        routed = self._routed[run_id] = deque()
+        state = {'submitted': 0, 'done': False, 'error': None, 'stop': False}
+
+        def put(batch) -> bool:
+            while not state['stop']:
+                try:
+                    self._jobs.put((run_id, handler, batch), timeout=_FLUSH_INTERVAL)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def feed() -> None:
+            try:
+                jobs = ((index, method, url, kwargs) for index, url in enumerate(urls))
+                while not state['stop']:
+                    batch = list(itertools.islice(jobs, self.batch_size))
+                    if not batch or not put(batch):
+                        break
+                    state['submitted'] += len(batch)
+            except BaseException as exc:
+                state['error'] = exc
+            finally:
+                state['done'] = True
+
+        feeder = threading.Thread(target=feed, name='requests-async-feeder', daemon=True)
+        feeder.start()
+        received = 0
+        finished = False
+        try:
+            while not (state['done'] and received >= state['submitted']):
+                if state['error'] is not None:
+                    raise state['error']
+                try:
+                    payload = self._next_payload(run_id, routed)
+                except queue.Empty:
+                    self._check_workers()
+                    continue
+                if payload is None:
+                    continue
+                for index, ok, value in pickle.loads(payload):
+                    received += 1
+                    if not ok and not return_exceptions:
+                        raise value
+                    yield index, value
+            finished = True
+        finally:
+            del self._routed[run_id]
+            if not finished:
+                state['stop'] = True
+                self._cancelled[run_id % _CANCEL_SLOTS] = run_id
+        if state['error'] is not None:
+            raise state['error']
+
+    def map(self, method: str, urls: Iterable[str],
+            handler: Optional[Callable[[Any], Any]] = None,
+            return_exceptions: bool = False,
+            **kwargs) -> Iterator[Any]:
+        """Like :meth:`as_completed`, but yield results in input order"""
+        waiting: Dict[int, Any] = {}
+        next_index = 0
+        results = self.as_completed(method, urls, handler=handler,
+                                    return_exceptions=return_exceptions, **kwargs)
+        try:
+            for index, value in results:
+                waiting[index] = value
+                while next_index in waiting:
+                    yield waiting.pop(next_index)
+                    next_index += 1
+        finally:
+            # Cancel the run now rather than whenever the generator is collected
+            results.close()
+
+    def _next_payload(self, run_id: int, routed: deque) -> Optional[bytes]:
+        """
+        Return the next result batch for ``run_id``, or None if the batch read
+        belonged to another run; raises queue.Empty on timeout
+        """
+        if routed:
+            return routed.popleft()
+        with self._results_lock:
+            # Another run may have routed our batch while we waited for the lock
+            if routed:
+                return routed.popleft()
+            result_run, payload = self._results.get(timeout=_FLUSH_INTERVAL)
+        if result_run == run_id:
+            return payload
+        owner = self._routed.get(result_run)
+        if owner is not None:  # otherwise the run has finished or was abandoned
+            owner.append(payload)
+        return None
+
+    def _check_workers(self) -> None:
+        dead = [p for p in self._processes if not p.is_alive()]
+        if dead:
+            raise RuntimeError(f"Worker process exited with code {dead[0].exitcode}")
+
+    def close(self) -> None:
+        """Stop the workers after they finish the jobs already queued"""
+        if not self._processes:
+            return
+        for _ in self._processes:
+            self._jobs.put(None)
+        # Drain unread results so workers can flush their queues and exit
+        while any(p.is_alive() for p in self._processes):
+            try:
+                self._results.get(timeout=_FLUSH_INTERVAL)
+            except queue.Empty:
+                pass
+        for process in self._processes:
+            process.join()
+        self._processes = []
+        self._jobs.close()
+        self._results.close()
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
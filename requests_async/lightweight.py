@@ -0,0 +1,93 @@
+"""
+Compact response objects for bulk workloads
+"""
+
+import json as _json
+from typing import Any, Dict, Iterable, Optional
+
+import httpx
+
+DEFAULT_KEEP_HEADERS = ('content-type',)
+
+
+class LightResponse:
+    """
+    Slot-based response keeping only status, selected headers, body and timing
+
+    Returned instead of ``httpx.Response`` when a session or request uses
+    ``lightweight=True``. The request object, full header structure, history
+    and extensions are dropped; text and JSON are decoded on demand.
+    """
+
+    __slots__ = ('status_code', 'url', 'headers', 'content', 'elapsed', '_text')
+
+    def __init__(self, status_code: int, url: str, headers: Dict[str, str],
+                 content: bytes, elapsed: float):
+        self.status_code = status_code
+        self.url = url
+        self.headers = headers
+        self.content = content
+        self.elapsed = elapsed
+        self._text: Optional[str] = None
+
+    @classmethod
+    def from_response(cls, response: httpx.Response,
+                      keep_headers: Iterable[str] = DEFAULT_KEEP_HEADERS) -> 'LightResponse':
+        """Copy the retained fields out of a fully read ``httpx.Response``"""
+        source = response.headers
+        headers = {name: source[name] for name in keep_headers if name in source}
+        try:
+            elapsed = response.elapsed.total_seconds()
+        except RuntimeError:
+            # Responses with preloaded content (e.g. from MockTransport) are never closed
+            elapsed = 0.0
+        return cls(response.status_code, str(response.url), headers, response.content, elapsed)
+
+    @property
+    def encoding(self) -> str:
+        """Charset from the retained Content-Type header, defaulting to utf-8"""
+        content_type = self.headers.get('content-type', '')
+        for param in content_type.split(';')[1:]:
+            key, _, value = param.strip().partition('=')
+            if key.lower() == 'charset' and value:
+                return value.strip('"\'')
+        return 'utf-8'
+
+    @property
+    def text(self) -> str:
+        """Body decoded with :attr:`encoding` (cached after first access)"""
+        if self._text is None:
+            self._text = self.content.decode(self.encoding, errors='replace')
+        return self._text
+
+    def json(self, **kwargs) -> Any:
+        """Parse the body as JSON"""
+        return _json.loads(self.content, **kwargs)
+
+    def view(self) -> memoryview:
+        """Zero-copy view of the body"""
+        return memoryview(self.content)
+
+    @property
+    def is_success(self) -> bool:
+        return 200 <= self.status_code < 300
+
+    def raise_for_status(self) -> 'LightResponse':
+        """Raise ``httpx.HTTPStatusError`` for 4xx/5xx responses"""
+        if self.status_code >= 400:
+            kind = 'Client error' if self.status_code < 500 else 'Server error'
+            raise httpx.HTTPStatusError(
+                f"{kind} '{self.status_code}' for url '{self.url}'",
+                request=None, response=self,
+            )
+        return self
+
+    def __getstate__(self):
+        return (self.status_code, self.url, self.headers, self.content, self.elapsed)
+
+    def __setstate__(self, state):
+        self.status_code, self.url, self.headers, self.content, self.elapsed = state
+        self._text = None
+
+    def __repr__(self) -> str:
+        return f"<LightResponse [{self.status_code}]>"
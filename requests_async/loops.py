@@ -0,0 +1,136 @@
+"""
+Event loop selection (optional uvloop) and per-loop session pooling
+"""
+
+import asyncio
+import weakref
+from typing import Awaitable, Dict, TypeVar
+
+from .client import AsyncSession
+
+T = TypeVar('T')
+
+_uvloop = None
+
+
+def _import_uvloop():
+    # Imported on first use so plain asyncio users never pay for the probe
+    global _uvloop
+    if _uvloop is None:
+        try:
+            import uvloop
+        except ImportError:  # pragma: no cover - optional dependency
+            uvloop = False
+        _uvloop = uvloop
+    return _uvloop or None
+
+
+def uvloop_available() -> bool:
+    """Return True when uvloop is installed"""
+    return _import_uvloop() is not None
+
+
+def new_event_loop(use_uvloop: bool = False) -> asyncio.AbstractEventLoop:
+    """
+    Create an event loop, using uvloop when requested and installed
+
+    Args:
+        use_uvloop: Opt in to uvloop; falls back to the stdlib loop when
+                    uvloop is not installed
+    """
+    uvloop = _import_uvloop() if use_uvloop else None
+    if uvloop is not None:
+        return uvloop.new_event_loop()
+    return asyncio.new_event_loop()
+
+
+def install_uvloop() -> bool:
+    """Make uvloop the default loop policy if installed; return whether it was installed"""
+    uvloop = _import_uvloop()
+    if uvloop is None:
+        return False
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
+
+
+def run(main: Awaitable[T], use_uvloop: bool = False) -> T:
+    """
+    Run a coroutine to completion on a fresh loop, like ``asyncio.run``
+
+    Example:
+        requests_async.loops.run(main(), use_uvloop=True)
+    """
+    loop = new_event_loop(use_uvloop)
+    try:
+        asyncio.set_event_loop(loop)
+        return loop.run_until_complete(main)
+    finally:
+        try:
+            loop.run_until_complete(loop.shutdown_asyncgens())
+            if hasattr(loop, 'shutdown_default_executor'):
+                loop.run_until_complete(loop.shutdown_default_executor())
+        finally:
+            asyncio.set_event_loop(None)
+            loop.close()
+
+
+async def _session_lifetime(session: AsyncSession, sessions: weakref.WeakKeyDictionary):
+    # Suspended async generators are closed by loop.shutdown_asyncgens(),
+    # which asyncio.run() calls before closing the loop
+    try:
+        yield
+    finally:
+        # The entry references the loop (via session._loop), so the weak key
+        # alone would never let it go
+        loop = asyncio.get_running_loop()
+        entry = sessions.get(loop)
+        if entry is not None and entry[0] is session:
+            del sessions[loop]
+        await session.__aexit__(None, None, None)
+
+
+class SessionRegistry:
+    """
+    Keep one pooled AsyncSession per event loop
+
+    The session for a loop is created on first use and closed automatically
+    when that loop shuts down (``asyncio.run`` / :func:`run`), so code running
+    on several loops never shares a client across them.
+
+    Args:
+        **session_kwargs: AsyncSession arguments for every session
+
+    Example:
+        registry = SessionRegistry(timeout=10.0)
+
+        async def fetch(url):
+            session = await registry.get()
+            return await session.get(url)
+    """
+
+    def __init__(self, **session_kwargs):
+        self._session_kwargs = session_kwargs
+        self._sessions = weakref.WeakKeyDictionary()
+
+    async def get(self) -> AsyncSession:
+        """Return the session bound to the running loop, creating it if needed"""
+        loop = asyncio.get_running_loop()
+        entry = self._sessions.get(loop)
+        if entry is not None:
+            return entry[0]
+        session = AsyncSession(**self._session_kwargs)
+        await session.__aenter__()
+        lifetime = _session_lifetime(session, self._sessions)
+        await lifetime.__anext__()
+        self._sessions[loop] = (session, lifetime)
+        return session
+
+    async def aclose(self) -> None:
+        """Close the running loop's session now instead of at loop shutdown"""
+        entry = self._sessions.pop(asyncio.get_running_loop(), None)
+        if entry is not None:
+            await entry[1].aclose()
+
+    def stats(self) -> Dict[str, int]:
+        """Return the number of loops currently holding a session"""
+        return {'sessions': len(self._sessions)}
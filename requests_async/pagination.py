@@ -0,0 +1,269 @@
+"""
+Pagination strategies and the prefetching page iterator behind AsyncSession.paginate
+"""
+
+import asyncio
+from collections import deque
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Tuple, Union
+
+import httpx
+
+ItemsPath = Union[None, str, Callable[[Any], Any]]
+
+
+def _extract(data: Any, path: ItemsPath) -> Any:
+    """Pull a value out of decoded JSON using a dotted path or a callable"""
+    if path is None:
+        return data
+    if callable(path):
+        return path(data)
+    for key in path.split('.'):
+        if data is None:
+            return None
+        data = data.get(key) if isinstance(data, dict) else None
+    return data
+
+
+class PaginationStrategy:
+    """
+    Base class for pagination strategies
+
+    Sequential strategies discover the next page from the current response
+    (``next_request``). Strategies with ``prefetchable = True`` can compute
+    the request for any page index up front (``request_for``), which lets
+    the iterator keep several pages in flight at once.
+    """
+
+    prefetchable = False
+
+    def __init__(self, items_key: ItemsPath = None):
+        self.items_key = items_key
+
+    def items(self, response: httpx.Response) -> List[Any]:
+        """Return the items contained in a page"""
+        items = _extract(response.json(), self.items_key)
+        if items is None:
+            return []
+        if not isinstance(items, list):
+            # Iterating a dict would silently yield its keys
+            hint = ("the body is an object; set items_key to the field holding the items"
+                    if self.items_key is None else f"check items_key={self.items_key!r}")
+            raise TypeError(f"Expected a JSON array of items, got {type(items).__name__}: {hint}")
+        return items
+
+    def next_request(self, response: httpx.Response, url: str,
+                     params: Dict[str, Any]) -> Optional[Tuple[str, Optional[Dict[str, Any]]]]:
+        """Return ``(url, params)`` for the page after ``response``, or None when done"""
+        raise NotImplementedError
+
+    def request_for(self, index: int, url: str,
+                    params: Dict[str, Any]) -> Tuple[str, Optional[Dict[str, Any]]]:
+        """Return ``(url, params)`` for the page at ``index`` (prefetchable strategies only)"""
+        raise NotImplementedError
+
+    def is_last(self, response: httpx.Response, items: List[Any],
+                first_page_size: Optional[int] = None) -> bool:
+        """
+        Whether ``response`` is the final page (prefetchable strategies only)
+
+        ``first_page_size`` is the number of items on the first page, for
+        strategies that infer the page size from it.
+        """
+        return not items
+
+
+class LinkHeaderPagination(PaginationStrategy):
+    """Follow the ``rel="next"`` entry of the RFC 8288 ``Link`` header"""
+
+    def next_request(self, response, url, params):
+        next_url = response.links.get('next', {}).get('url')
+        if not next_url:
+            return None
+        # The next link already carries its own query string
+        return str(response.url.join(next_url)), None
+
+
+class CursorPagination(PaginationStrategy):
+    """
+    Follow an opaque cursor returned in the JSON body
+
+    Args:
+        cursor_param: Query parameter the cursor is sent back in
+        next_cursor: Dotted path (or callable) locating the next cursor in the body
+        items_key: Dotted path (or callable) locating the items in the body
+    """
+
+    def __init__(self, cursor_param: str = 'cursor',
+                 next_cursor: ItemsPath = 'next_cursor',
+                 items_key: ItemsPath = 'items'):
+        super().__init__(items_key)
+        self.cursor_param = cursor_param
+        self.next_cursor = next_cursor
+
+    def next_request(self, response, url, params):
+        cursor = _extract(response.json(), self.next_cursor)
+        if cursor in (None, ''):
+            return None
+        return url, {**params, self.cursor_param: cursor}
+
+
+class OffsetPagination(PaginationStrategy):
+    """
+    Offset/limit pagination; pages can be prefetched
+
+    Args:
+        limit: Page size requested from the API
+        offset_param: Query parameter carrying the offset
+        limit_param: Query parameter carrying the page size
+        start: Offset of the first page
+        items_key: Dotted path (or callable) locating the items in the body
+    """
+
+    prefetchable = True
+
+    def __init__(self, limit: int = 100, offset_param: str = 'offset',
+                 limit_param: str = 'limit', start: int = 0,
+                 items_key: ItemsPath = None):
+        super().__init__(items_key)
+        self.limit = limit
+        self.offset_param = offset_param
+        self.limit_param = limit_param
+        self.start = start
+
+    def request_for(self, index, url, params):
+        return url, {**params,
+                     self.offset_param: self.start + index * self.limit,
+                     self.limit_param: self.limit}
+
+    def is_last(self, response, items, first_page_size=None):
+        return len(items) < self.limit
+
+
+class PageNumberPagination(PaginationStrategy):
+    """
+    Page-number pagination; pages can be prefetched
+
+    Args:
+        page_param: Query parameter carrying the page number
+        start: Number of the first page
+        page_size: Expected page size; a shorter page ends iteration early
+                   (default: the size of the first page)
+        size_param: Query parameter carrying ``page_size``, if the API takes one
+        items_key: Dotted path (or callable) locating the items in the body
+    """
+
+    prefetchable = True
+
+    def __init__(self, page_param: str = 'page', start: int = 1,
+                 page_size: Optional[int] = None, size_param: Optional[str] = None,
+                 items_key: ItemsPath = None):
+        super().__init__(items_key)
+        self.page_param = page_param
+        self.start = start
+        self.page_size = page_size
+        self.size_param = size_param
+
+    def request_for(self, index, url, params):
+        page_params = {**params, self.page_param: self.start + index}
+        if self.size_param and self.page_size:
+            page_params[self.size_param] = self.page_size
+        return url, page_params
+
+    def is_last(self, response, items, first_page_size=None):
+        if not items:
+            return True
+        page_size = self.page_size or first_page_size
+        return page_size is not None and len(items) < page_size
+
+
+STRATEGIES = {
+    'link': LinkHeaderPagination,
+    'cursor': CursorPagination,
+    'offset': OffsetPagination,
+    'page': PageNumberPagination,
+}
+
+
+def get_strategy(strategy: Union[str, PaginationStrategy]) -> PaginationStrategy:
+    """Resolve a strategy name to a default-configured strategy instance"""
+    if isinstance(strategy, PaginationStrategy):
+        return strategy
+    try:
+        return STRATEGIES[strategy]()
+    except KeyError:
+        raise ValueError(
+            f"Unknown pagination strategy {strategy!r}; "
+            f"expected one of {sorted(STRATEGIES)} or a PaginationStrategy instance"
+        ) from None
+
+
+async def paginate(session, method: str, url: str,
+                   strategy: PaginationStrategy,
+                   prefetch: int = 1,
+                   max_pages: Optional[int] = None,
+                   **kwargs) -> AsyncIterator[Any]:
+    """
+    Yield items from every page, keeping up to ``prefetch`` further pages in flight
+
+    Sequential strategies can only overlap one page ahead: the next request is
+    sent as soon as the current page arrives, before its items are consumed.
+    For prefetchable strategies a 404 on any page after the first ends
+    iteration, since many APIs answer the page past the end that way.
+    """
+    params = dict(kwargs.pop('params', None) or {})
+    inflight: deque = deque()
+
+    def fetch(page_url: str, page_params: Optional[Dict[str, Any]]) -> asyncio.Task:
+        async def _get():
+            # Strategies need the full response (Link header, URL joining)
+            response = await session.request(method, page_url, params=page_params,
+                                             lightweight=False, **kwargs)
+            response.raise_for_status()
+            return response
+        return asyncio.ensure_future(_get())
+
+    try:
+        if strategy.prefetchable:
+            scheduled = 0
+            first_page_size: Optional[int] = None
+
+            def schedule():
+                nonlocal scheduled
+                if max_pages is None or scheduled < max_pages:
+                    inflight.append(fetch(*strategy.request_for(scheduled, url, params)))
+                    scheduled += 1
+
+            for _ in range(max(prefetch, 0) + 1):
+                schedule()
+            while inflight:
+                try:
+                    response = await inflight.popleft()
+                except httpx.HTTPStatusError as exc:
+                    if exc.response.status_code != 404 or first_page_size is None:
+                        raise
+                    break  # past the last page; remaining tasks are cancelled below
+                items = strategy.items(response)
+                if first_page_size is None:
+                    first_page_size = len(items)
+                if strategy.is_last(response, items, first_page_size):
+                    for task in inflight:
+                        task.cancel()
+                    inflight.clear()
+                else:
+                    schedule()
+                for item in items:
+                    yield item
+        else:
+            pages = 1
+            inflight.append(fetch(url, params))
+            while inflight:
+                response = await inflight.popleft()
+                nxt = strategy.next_request(response, url, params)
+                if nxt is not None and (max_pages is None or pages < max_pages):
+                    inflight.append(fetch(*nxt))
+                    pages += 1
+                for item in strategy.items(response):
+                    yield item
+    finally:
+        for task in inflight:
+            task.cancel()
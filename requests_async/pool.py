@@ -0,0 +1,343 @@
+"""
+Connection pool introspection and automatic pool sizing behind AsyncSession.pool_stats
+
+Pool wait and upstream latency are told apart with httpcore trace events: a
+request waits in the pool from the moment it is handed to the transport until
+it either starts opening a connection or starts writing headers on a reused
+one; upstream latency runs from sending headers to receiving the response
+headers.
+"""
+
+import math
+import time
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional
+
+import httpx
+
+_DEFAULT_PORTS = {'http': 80, 'https': 443, 'ws': 80, 'wss': 443}
+
+
+def _percentile(values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of ``values`` (0.0 when empty)"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[max(math.ceil(pct / 100 * len(ordered)) - 1, 0)]
+
+
+def get_pools(client: httpx.AsyncClient) -> List[Any]:
+    """Return the httpcore connection pools behind a client's transports and mounts"""
+    transports = [getattr(client, '_transport', None),
+                  *getattr(client, '_mounts', {}).values()]
+    pools: List[Any] = []
+    for transport in transports:
+        # Custom transports (MockTransport, ...) have no pool to inspect
+        pool = getattr(transport, '_pool', None)
+        if pool is not None and hasattr(pool, 'connections') and pool not in pools:
+            pools.append(pool)
+    return pools
+
+
+def get_pool_limits(pool) -> Dict[str, Optional[int]]:
+    """Current connection limits of an httpcore pool (None means unlimited)"""
+    limits = {}
+    for name in ('max_connections', 'max_keepalive_connections'):
+        value = getattr(pool, f'_{name}', None)
+        limits[name] = None if value is None or value >= 2 ** 62 else value
+    return limits
+
+
+def set_pool_limits(pool, max_connections: int,
+                    max_keepalive_connections: Optional[int] = None) -> None:
+    """
+    Resize a live httpcore pool
+
+    Growing takes effect on the next request the pool assigns; shrinking
+    closes surplus connections as they become idle rather than interrupting
+    requests in flight.
+    """
+    if max_keepalive_connections is None:
+        max_keepalive_connections = max_connections
+    pool._max_connections = max_connections
+    pool._max_keepalive_connections = min(max_connections, max_keepalive_connections)
+
+
+def _connection_origin(connection) -> str:
+    # Proxied connections are keyed by the origin they tunnel or forward to
+    origin = getattr(connection, '_remote_origin', None) or getattr(connection, '_origin', None)
+    return str(origin) if origin is not None else 'unknown'
+
+
+def _request_origin(url: httpx.URL) -> str:
+    # Same format as str(httpcore.Origin), so metrics line up with pool snapshots
+    return f'{url.scheme}://{url.host}:{url.port or _DEFAULT_PORTS.get(url.scheme, 0)}'
+
+
+class _OriginStats:
+    __slots__ = ('requests', 'new_connections', 'wait_total', 'wait_max',
+                 'latency_total', 'waits')
+
+    def __init__(self, window: int):
+        self.requests = 0
+        self.new_connections = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+        self.latency_total = 0.0
+        self.waits: Deque[float] = deque(maxlen=window)
+
+
+class PoolAutoTuner:
+    """
+    Grow or shrink the pool's connection limits from observed wait and latency
+
+    Every ``interval`` seconds (checked as responses arrive) the recent requests
+    are examined:
+
+    - p95 pool wait above ``wait_threshold`` means requests queue for a
+      connection: the limit grows by ``step``, unless median upstream latency
+      has risen above ``latency_tolerance`` times its baseline, in which case
+      more connections would only load an already saturated upstream and the
+      limit shrinks instead.
+    - no pool wait and peak demand under half the limit means idle capacity:
+      the limit shrinks towards twice the peak.
+
+    The keepalive limit follows ``max_connections`` so grown capacity is reused
+    instead of reconnected.
+
+    Args:
+        min_connections: Lower bound for max_connections (default: 10)
+        max_connections: Upper bound for max_connections (default: 1000)
+        interval: Seconds between adjustments (default: 5.0)
+        min_samples: Requests needed in an interval before adjusting (default: 20)
+        wait_threshold: p95 pool wait in seconds treated as contention (default: 0.01)
+        latency_tolerance: Upstream latency over baseline treated as saturation (default: 1.5)
+        step: Growth and shrink factor (default: 1.5)
+    """
+
+    def __init__(self, min_connections: int = 10, max_connections: int = 1000,
+                 interval: float = 5.0, min_samples: int = 20,
+                 wait_threshold: float = 0.01, latency_tolerance: float = 1.5,
+                 step: float = 1.5):
+        if not 1 <= min_connections <= max_connections:
+            raise ValueError("expected 1 <= min_connections <= max_connections")
+        if step <= 1:
+            raise ValueError("step must be greater than 1")
+        self.min_connections = min_connections
+        self.max_connections = max_connections
+        self.interval = interval
+        self.min_samples = min_samples
+        self.wait_threshold = wait_threshold
+        self.latency_tolerance = latency_tolerance
+        self.step = step
+        self.limit: Optional[int] = None
+        self.baseline_latency: Optional[float] = None
+        self.adjustments = 0
+        self.last_reason: Optional[str] = None
+        self._waits: List[float] = []
+        self._latencies: List[float] = []
+        self._peak_demand = 0
+        self._interval_start = time.monotonic()
+
+    def _clamp(self, limit: int) -> int:
+        return max(self.min_connections, min(self.max_connections, limit))
+
+    def start(self, pools: List[Any]) -> None:
+        """Adopt the pools' configured limit (clamped to the tuner's bounds)"""
+        configured = [get_pool_limits(pool)['max_connections'] for pool in pools]
+        self.limit = self._clamp(max((c or self.max_connections) for c in configured)
+                                 if configured else self.min_connections)
+        for pool in pools:
+            set_pool_limits(pool, self.limit)
+        self._interval_start = time.monotonic()
+
+    def observe(self, wait: float, latency: float, demand: int) -> None:
+        """Record one request's pool wait, upstream latency and the pool's demand"""
+        self._waits.append(wait)
+        self._latencies.append(latency)
+        if demand > self._peak_demand:
+            self._peak_demand = demand
+
+    def due(self) -> bool:
+        return (len(self._waits) >= self.min_samples
+                and time.monotonic() - self._interval_start >= self.interval)
+
+    def decide(self, limit: int, waits: List[float], latencies: List[float],
+               peak_demand: int) -> int:
+        """Return the new limit for one interval's observations"""
+        latency = _percentile(latencies, 50)
+        if self.baseline_latency is None or latency < self.baseline_latency:
+            self.baseline_latency = latency
+        else:
+            # Drift up slowly so a permanently slower upstream becomes the new normal
+            self.baseline_latency += (latency - self.baseline_latency) * 0.1
+        saturated = latency > self.baseline_latency * self.latency_tolerance
+
+        if _percentile(waits, 95) > self.wait_threshold:
+            if saturated:
+                self.last_reason = 'upstream latency rising'
+                return self._clamp(int(limit / self.step))
+            self.last_reason = 'pool wait'
+            return self._clamp(math.ceil(limit * self.step))
+        if peak_demand * 2 < limit:
+            self.last_reason = 'idle capacity'
+            return self._clamp(max(int(limit / self.step), peak_demand * 2))
+        return limit
+
+    def adjust(self, pools: List[Any]) -> None:
+        """Close the current interval and resize ``pools`` if needed"""
+        limit = self.limit if self.limit is not None else self.max_connections
+        new_limit = self.decide(limit, self._waits, self._latencies, self._peak_demand)
+        if new_limit != limit:
+            for pool in pools:
+                set_pool_limits(pool, new_limit)
+            self.adjustments += 1
+        self.limit = new_limit
+        self._waits, self._latencies, self._peak_demand = [], [], 0
+        self._interval_start = time.monotonic()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            'max_connections': self.limit,
+            'adjustments': self.adjustments,
+            'last_reason': self.last_reason,
+            'baseline_latency': self.baseline_latency,
+        }
+
+
+class PoolMonitor:
+    """
+    Collect per-origin pool wait, upstream latency and connection reuse
+
+    Installed by AsyncSession as an httpx ``request`` event hook; it adds a
+    trace extension to each request, chaining any trace the caller set.
+
+    Args:
+        window: Recent wait samples kept per origin for percentiles (default: 1000)
+        tuner: Optional PoolAutoTuner fed with every observation
+    """
+
+    def __init__(self, window: int = 1000, tuner: Optional[PoolAutoTuner] = None):
+        self.window = window
+        self.tuner = tuner
+        self.pools: List[Any] = []
+        self._origins: Dict[str, _OriginStats] = {}
+
+    def attach(self, client: httpx.AsyncClient) -> None:
+        """Bind to the pools of a newly opened client"""
+        self.pools = get_pools(client)
+        if self.tuner is not None and self.pools:
+            self.tuner.start(self.pools)
+
+    async def on_request(self, request: httpx.Request) -> None:
+        started = time.perf_counter()
+        acquired: Optional[float] = None
+        sent: Optional[float] = None
+        new_connection = recorded = False
+        origin = _request_origin(request.url)
+        previous = request.extensions.get('trace')
+        # Redirects reuse the extensions dict; don't wrap our own trace again
+        previous = getattr(previous, 'wrapped_trace', previous)
+
+        async def trace(event: str, info: Dict[str, Any]) -> None:
+            nonlocal acquired, sent, new_connection, recorded
+            if acquired is None:
+                if event.startswith('connection.connect_') and event.endswith('.started'):
+                    new_connection = True
+                    acquired = time.perf_counter()
+                elif event.endswith('.send_request_headers.started'):
+                    acquired = time.perf_counter()
+            if sent is None:
+                if event.endswith('.send_request_headers.started'):
+                    sent = time.perf_counter()
+            elif not recorded and event.endswith('.receive_response_headers.complete'):
+                # Record once; through a tunnelling proxy this is the CONNECT reply
+                recorded = True
+                self.record(origin, acquired - started, time.perf_counter() - sent,
+                            new_connection)
+            if previous is not None:
+                await previous(event, info)
+
+        trace.wrapped_trace = previous
+        request.extensions['trace'] = trace
+
+    def record(self, origin: str, wait: float, latency: float, new_connection: bool) -> None:
+        """Account one request that received response headers"""
+        stats = self._origins.get(origin)
+        if stats is None:
+            stats = self._origins[origin] = _OriginStats(self.window)
+        stats.requests += 1
+        stats.new_connections += new_connection
+        stats.wait_total += wait
+        stats.latency_total += latency
+        stats.waits.append(wait)
+        if wait > stats.wait_max:
+            stats.wait_max = wait
+        if self.tuner is not None and self.pools:
+            demand = max(len(getattr(pool, '_requests', ())) for pool in self.pools)
+            self.tuner.observe(wait, latency, demand)
+            if self.tuner.due():
+                self.tuner.adjust(self.pools)
+
+    def stats(self) -> Dict[str, Any]:
+        """See :meth:`AsyncSession.pool_stats`"""
+        return pool_stats(self.pools, self)
+
+
+def _ratio(part: float, whole: float) -> float:
+    return part / whole if whole else 0.0
+
+
+def pool_stats(pools: List[Any], monitor: Optional[PoolMonitor] = None) -> Dict[str, Any]:
+    """
+    Snapshot connections per origin, merged with the monitor's metrics if any
+    """
+    origins: Dict[str, Dict[str, Any]] = {}
+    queued = 0
+    for pool in pools:
+        for connection in pool.connections:
+            entry = origins.setdefault(_connection_origin(connection), {'active': 0, 'idle': 0})
+            if connection.is_idle():
+                entry['idle'] += 1
+            elif not connection.is_closed():
+                entry['active'] += 1
+        queued += sum(1 for request in getattr(pool, '_requests', ()) if request.is_queued())
+
+    result: Dict[str, Any] = {
+        'limits': get_pool_limits(pools[0]) if pools else None,
+        'queued': queued,
+        'origins': origins,
+    }
+    if monitor is None:
+        return result
+
+    requests = new_connections = 0
+    wait_total = latency_total = wait_max = 0.0
+    recent: List[float] = []
+    for origin, stats in monitor._origins.items():
+        entry = origins.setdefault(origin, {'active': 0, 'idle': 0})
+        entry.update(
+            requests=stats.requests,
+            new_connections=stats.new_connections,
+            reuse_ratio=_ratio(stats.requests - stats.new_connections, stats.requests),
+            avg_wait=_ratio(stats.wait_total, stats.requests),
+            p95_wait=_percentile(list(stats.waits), 95),
+            max_wait=stats.wait_max,
+            avg_latency=_ratio(stats.latency_total, stats.requests),
+        )
+        requests += stats.requests
+        new_connections += stats.new_connections
+        wait_total += stats.wait_total
+        latency_total += stats.latency_total
+        wait_max = max(wait_max, stats.wait_max)
+        recent.extend(stats.waits)
+    result.update(
+        requests=requests,
+        reuse_ratio=_ratio(requests - new_connections, requests),
+        avg_wait=_ratio(wait_total, requests),
+        p95_wait=_percentile(recent, 95),
+        max_wait=wait_max,
+        avg_latency=_ratio(latency_total, requests),
+        tuning=monitor.tuner.stats() if monitor.tuner is not None else None,
+    )
+    return result
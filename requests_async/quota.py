@@ -0,0 +1,312 @@
+"""
+Quota backends: where a RateLimiter's token bucket lives
+
+Backends hand out tokens in batches (leases) so the limiter only coordinates
+with other processes or nodes once per ``lease_size`` requests.
+
+- :class:`LocalQuotaBackend`: in-process (default)
+- :class:`SharedMemoryQuotaBackend`: processes started from one parent
+- :class:`FileLockQuotaBackend`: any processes on one host
+- :class:`RedisQuotaBackend`: processes on many nodes, via a Redis-protocol server
+"""
+
+import asyncio
+import multiprocessing
+import os
+import struct
+import threading
+import time
+from typing import List, Optional, Sequence, Tuple
+from urllib.parse import unquote, urlparse
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+
+Lease = Tuple[int, float]
+
+
+def take_from_bucket(tokens: float, updated: float, now: float, count: int,
+                     rate: float, burst: float) -> Tuple[float, float, int, float]:
+    """
+    Refill a token bucket and take up to ``count`` whole tokens
+
+    Returns ``(tokens, updated, granted, retry_after)``; ``retry_after`` is the
+    delay until one token is available when nothing could be granted.
+    """
+    elapsed = now - updated
+    if elapsed < 0:  # clock stepped backwards, or another writer read the clock later
+        elapsed = 0.0
+    tokens = min(burst, tokens + elapsed * rate)
+    granted = min(count, int(tokens)) if tokens >= 1 else 0
+    tokens -= granted
+    retry_after = 0.0 if granted else (1.0 - tokens) / rate
+    return tokens, now, granted, retry_after
+
+
+class QuotaBackend:
+    """Base class for token stores shared by one or more RateLimiters"""
+
+    async def take(self, count: int, rate: float, burst: float) -> Lease:
+        """
+        Take up to ``count`` tokens from the bucket
+
+        Returns ``(granted, retry_after)``: how many tokens were granted and,
+        if none, how many seconds to wait before trying again.
+        """
+        raise NotImplementedError
+
+    async def aclose(self) -> None:
+        """Release connections or file handles"""
+
+
+class LocalQuotaBackend(QuotaBackend):
+    """Bucket held in process memory"""
+
+    def __init__(self):
+        self._tokens: Optional[float] = None
+        self._updated = time.monotonic()
+
+    async def take(self, count, rate, burst):
+        tokens = burst if self._tokens is None else self._tokens
+        self._tokens, self._updated, granted, retry = take_from_bucket(
+            tokens, self._updated, time.monotonic(), count, rate, burst
+        )
+        return granted, retry
+
+
+class SharedMemoryQuotaBackend(QuotaBackend):
+    """
+    Bucket in shared memory for processes started from one parent
+
+    Create it before starting the children and pass it to them (directly or
+    inside a RateLimiter), as :class:`ProcessExecutor` does.
+
+    Args:
+        context: multiprocessing context used to allocate the shared state
+    """
+
+    def __init__(self, context=None):
+        context = context or multiprocessing.get_context()
+        # tokens < 0 marks an untouched bucket that should start full
+        self._state = context.Array('d', [-1.0, time.monotonic()])
+
+    async def take(self, count, rate, burst):
+        with self._state.get_lock():
+            tokens = burst if self._state[0] < 0 else self._state[0]
+            tokens, updated, granted, retry = take_from_bucket(
+                tokens, self._state[1], time.monotonic(), count, rate, burst
+            )
+            self._state[0], self._state[1] = tokens, updated
+        return granted, retry
+
+
+class FileLockQuotaBackend(QuotaBackend):
+    """
+    Bucket stored in a small file guarded by ``flock``, for any processes on one host
+
+    Unrelated processes (separate services, cron jobs, ...) pointing at the same
+    path share one quota. Uses wall-clock time so state survives restarts.
+    POSIX only.
+
+    Args:
+        path: State file; created if missing
+    """
+
+    _FORMAT = struct.Struct('<dd')
+
+    def __init__(self, path: str):
+        if fcntl is None:
+            raise RuntimeError("FileLockQuotaBackend requires fcntl (POSIX)")
+        self.path = path
+        self._fd: Optional[int] = None
+        self._lock = threading.Lock()
+
+    def __getstate__(self):
+        return {'path': self.path}
+
+    def __setstate__(self, state):
+        self.__init__(state['path'])
+
+    def _take_locked(self, count: int, rate: float, burst: float) -> Lease:
+        with self._lock:
+            if self._fd is None:
+                self._fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+            fcntl.flock(self._fd, fcntl.LOCK_EX)
+            try:
+                raw = os.pread(self._fd, self._FORMAT.size, 0)
+                now = time.time()
+                if len(raw) == self._FORMAT.size:
+                    tokens, updated = self._FORMAT.unpack(raw)
+                else:
+                    tokens, updated = burst, now
+                tokens, updated, granted, retry = take_from_bucket(
+                    tokens, updated, now, count, rate, burst
+                )
+                os.pwrite(self._fd, self._FORMAT.pack(tokens, updated), 0)
+            finally:
+                fcntl.flock(self._fd, fcntl.LOCK_UN)
+        return granted, retry
+
+    async def take(self, count, rate, burst):
+        # flock blocks while another process holds it, so keep it off the event loop
+        return await asyncio.get_running_loop().run_in_executor(
+            None, self._take_locked, count, rate, burst
+        )
+
+    async def aclose(self):
+        with self._lock:
+            if self._fd is not None:
+                os.close(self._fd)
+                self._fd = None
+
+
+class RedisError(Exception):
+    """Error reply from a Redis-protocol server"""
+
+
+class RedisQuotaBackend(QuotaBackend):
+    """
+    Fixed-window quota counted on a Redis-protocol server, for many nodes
+
+    Each lease is one pipelined ``INCRBY`` + ``PEXPIRE`` on a per-window key,
+    so any server speaking RESP (Redis, KeyDB, Valkey, Dragonfly, ...) works
+    without server-side scripts. A window admits ``rate * window`` requests;
+    ``burst`` is not used.
+
+    Args:
+        url: ``redis://[:password@]host[:port][/db]``
+        key: Key prefix identifying the shared quota
+        window: Window length in seconds (default: 1.0)
+        timeout: Connect and reply timeout in seconds
+    """
+
+    def __init__(self, url: str = 'redis://127.0.0.1:6379/0', key: str = 'requests-async:quota',
+                 window: float = 1.0, timeout: float = 5.0):
+        parsed = urlparse(url)
+        if parsed.scheme != 'redis':
+            raise ValueError(f"Unsupported Redis URL scheme: {parsed.scheme!r}")
+        self.url = url
+        self.key = key
+        self.window = window
+        self.timeout = timeout
+        self._host = parsed.hostname or '127.0.0.1'
+        self._port = parsed.port or 6379
+        self._password = unquote(parsed.password) if parsed.password else None
+        self._db = int(parsed.path.lstrip('/') or 0)
+        self._conn = None
+        self._loop = None
+        self._lock: Optional[asyncio.Lock] = None
+
+    def __getstate__(self):
+        return {'url': self.url, 'key': self.key, 'window': self.window, 'timeout': self.timeout}
+
+    def __setstate__(self, state):
+        self.__init__(**state)
+
+    @staticmethod
+    def _encode(*args) -> bytes:
+        out = [b'*%d\r\n' % len(args)]
+        for arg in args:
+            data = arg if isinstance(arg, bytes) else str(arg).encode()
+            out.append(b'$%d\r\n%s\r\n' % (len(data), data))
+        return b''.join(out)
+
+    async def _read_reply(self, reader: asyncio.StreamReader):
+        line = await reader.readline()
+        if not line:
+            raise ConnectionError("Redis connection closed")
+        kind, rest = line[:1], line[1:-2]
+        if kind == b'+':
+            return rest.decode()
+        if kind == b'-':
+            raise RedisError(rest.decode())
+        if kind == b':':
+            return int(rest)
+        if kind == b'$':
+            length = int(rest)
+            if length < 0:
+                return None
+            return (await reader.readexactly(length + 2))[:-2]
+        if kind == b'*':
+            length = int(rest)
+            return None if length < 0 else [await self._read_reply(reader) for _ in range(length)]
+        raise RedisError(f"Unexpected reply: {line!r}")
+
+    async def _connect(self):
+        reader, writer = await asyncio.wait_for(
+            asyncio.open_connection(self._host, self._port), self.timeout
+        )
+        setup = []
+        if self._password:
+            setup.append(('AUTH', self._password))
+        if self._db:
+            setup.append(('SELECT', self._db))
+        try:
+            if setup:
+                await self._execute_on_connection((reader, writer), setup)
+        except BaseException:
+            writer.close()
+            raise
+        # Only a fully authenticated connection on the right database is kept
+        self._conn = (reader, writer)
+
+    async def _execute_on_connection(self, conn, commands: Sequence[tuple]) -> List:
+        reader, writer = conn
+        writer.write(b''.join(self._encode(*command) for command in commands))
+        await writer.drain()
+        replies = []
+        error: Optional[RedisError] = None
+        # Read every reply even after an error so the next pipeline starts in sync
+        for _ in commands:
+            try:
+                replies.append(await asyncio.wait_for(self._read_reply(reader), self.timeout))
+            except RedisError as exc:
+                error = error or exc
+                replies.append(exc)
+        if error is not None:
+            raise error
+        return replies
+
+    async def execute(self, *commands: tuple) -> List:
+        """Send pipelined commands and return their replies"""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # Connections and locks belong to one event loop
+            self._conn, self._loop, self._lock = None, loop, asyncio.Lock()
+        async with self._lock:
+            try:
+                if self._conn is None:
+                    await self._connect()
+                return await self._execute_on_connection(self._conn, commands)
+            except (RedisError, ConnectionError, OSError, asyncio.TimeoutError,
+                    asyncio.IncompleteReadError):
+                # Error replies are rare; a fresh connection rules out any desync
+                await self._drop_connection()
+                raise
+
+    async def take(self, count, rate, burst):
+        now = time.time()
+        index = int(now // self.window)
+        key = f'{self.key}:{index}'
+        limit = max(int(rate * self.window), 1)
+        used, _ = await self.execute(
+            ('INCRBY', key, count),
+            ('PEXPIRE', key, int(self.window * 2000)),
+        )
+        granted = max(0, min(count, limit - (used - count)))
+        retry = 0.0 if granted else (index + 1) * self.window - now
+        return granted, retry
+
+    async def _drop_connection(self):
+        if self._conn is not None:
+            self._conn[1].close()
+            self._conn = None
+
+    async def aclose(self):
+        if self._lock is not None and self._loop is asyncio.get_running_loop():
+            async with self._lock:
+                await self._drop_connection()
+        else:
+            self._conn = None
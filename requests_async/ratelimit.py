@@ -0,0 +1,116 @@
+"""
+Token-bucket rate limiters used by AsyncSession and the process executor
+"""
+
+import asyncio
+import time
+from typing import Optional
+
+from .quota import LocalQuotaBackend, QuotaBackend, SharedMemoryQuotaBackend
+
+# Share of a second's quota leased per backend round trip with shared backends
+_LEASE_FRACTION = 0.05
+
+
+class RateLimiter:
+    """
+    Async token bucket allowing ``rate`` requests per second
+
+    The bucket itself lives in a :class:`QuotaBackend`; by default an
+    in-process one. With a shared backend, tokens are leased ``lease_size``
+    at a time so most requests are admitted from the local lease without
+    touching the backend.
+
+    Args:
+        rate: Sustained requests per second (across everyone sharing the backend)
+        burst: Bucket size, i.e. requests allowed back-to-back (default: max(rate, 1))
+        backend: Where the bucket lives (default: LocalQuotaBackend())
+        lease_size: Tokens taken from the backend per round trip (default: 1 for
+                    the local backend, else ``max(1, int(rate * 0.05))``)
+        lease_ttl: Seconds a lease stays valid; unused tokens are dropped after
+                   it so stale leases cannot burst past the rate
+                   (default: lease_size / rate, at least 0.1s)
+    """
+
+    def __init__(self, rate: float, burst: Optional[float] = None,
+                 backend: Optional[QuotaBackend] = None,
+                 lease_size: Optional[int] = None,
+                 lease_ttl: Optional[float] = None):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        backend = backend if backend is not None else LocalQuotaBackend()
+        if lease_size is None:
+            # Keep shared backends off the per-request path
+            lease_size = (1 if isinstance(backend, LocalQuotaBackend)
+                          else max(1, int(rate * _LEASE_FRACTION)))
+        if lease_size < 1:
+            raise ValueError("lease_size must be at least 1")
+        self.rate = float(rate)
+        self.burst = float(burst) if burst is not None else max(self.rate, 1.0)
+        self.backend = backend
+        self.lease_size = lease_size
+        self.lease_ttl = lease_ttl if lease_ttl is not None else max(lease_size / self.rate, 0.1)
+        self._leased = 0
+        self._lease_expires = 0.0
+        self._lock: Optional[asyncio.Lock] = None
+        self._lock_loop = None
+
+    def __getstate__(self):
+        # Leases and locks are per process; the backend carries any shared state
+        state = self.__dict__.copy()
+        state.update(_leased=0, _lease_expires=0.0, _lock=None, _lock_loop=None)
+        return state
+
+    def _get_lock(self) -> asyncio.Lock:
+        loop = asyncio.get_running_loop()
+        if self._lock is None or self._lock_loop is not loop:
+            self._lock, self._lock_loop = asyncio.Lock(), loop
+        return self._lock
+
+    def _take_leased(self) -> bool:
+        if self._leased and time.monotonic() < self._lease_expires:
+            self._leased -= 1
+            return True
+        self._leased = 0
+        return False
+
+    async def acquire(self) -> None:
+        """Wait until the next request may be sent"""
+        while not self._take_leased():
+            async with self._get_lock():
+                if self._take_leased():
+                    return
+                granted, retry_after = await self.backend.take(
+                    self.lease_size, self.rate, self.burst
+                )
+                if granted:
+                    self._leased = granted - 1
+                    self._lease_expires = time.monotonic() + self.lease_ttl
+                    return
+                # Hold the lock while waiting so queued callers don't all hit the backend
+                await asyncio.sleep(retry_after)
+
+    async def aclose(self) -> None:
+        """Close the backend's connections or file handles"""
+        await self.backend.aclose()
+
+
+class SharedRateLimiter(RateLimiter):
+    """
+    RateLimiter whose bucket lives in shared memory, for use across processes
+
+    Create it in the parent and hand it to child processes at start-up (as
+    :class:`ProcessExecutor` does); every process then draws from one bucket.
+
+    Args:
+        rate: Sustained requests per second across all processes
+        burst: Bucket size (default: max(rate, 1))
+        context: multiprocessing context used to allocate the shared state
+        lease_size: Tokens taken from shared memory at a time
+                    (default: ``max(1, int(rate * 0.05))``)
+    """
+
+    def __init__(self, rate: float, burst: Optional[float] = None, context=None,
+                 lease_size: Optional[int] = None):
+        super().__init__(rate, burst, backend=SharedMemoryQuotaBackend(context),
+                         lease_size=lease_size)
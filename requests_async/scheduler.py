@@ -0,0 +1,119 @@
+"""
+Priority-aware request scheduler placed in front of the connection pool
+"""
+
+import asyncio
+import heapq
+import itertools
+import time
+from typing import Any, Dict, List, Optional
+
+import httpx
+
+
+class DeadlineExceeded(httpx.TimeoutException):
+    """Raised when a request's deadline passes before it could be dispatched"""
+
+    def __init__(self, message: str = "Request deadline expired before dispatch"):
+        super().__init__(message)
+
+
+class RequestScheduler:
+    """
+    Admit at most ``max_concurrency`` requests at a time, highest priority first
+
+    Waiting requests are ordered by priority (higher runs first) and then by
+    arrival. A request whose deadline passes while queued is dropped with
+    :class:`DeadlineExceeded` and never reaches the network.
+
+    Args:
+        max_concurrency: Number of requests allowed in flight at once
+    """
+
+    def __init__(self, max_concurrency: int):
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        self.max_concurrency = max_concurrency
+        self._heap: List[list] = []
+        self._seq = itertools.count()
+        self._active = 0
+        self._dispatched = 0
+        self._expired = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+
+    async def acquire(self, priority: int = 0, deadline: Optional[float] = None) -> None:
+        """
+        Wait for a dispatch slot
+
+        Args:
+            priority: Higher values are dispatched first (default: 0)
+            deadline: Absolute ``time.monotonic()`` time after which the
+                      request is dropped instead of dispatched
+        """
+        start = time.monotonic()
+        if deadline is not None and deadline <= start:
+            self._expired += 1
+            raise DeadlineExceeded()
+        if self._active < self.max_concurrency and not self._heap:
+            self._grant(0.0)
+            return
+
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._heap, [-priority, next(self._seq), deadline, start, future])
+        try:
+            if deadline is None:
+                await future
+            else:
+                await asyncio.wait_for(future, deadline - start)
+        except asyncio.TimeoutError:
+            if self._granted(future):
+                self.release()
+            self._expired += 1
+            raise DeadlineExceeded() from None
+        except asyncio.CancelledError:
+            if self._granted(future):
+                self.release()
+            raise
+
+    def release(self) -> None:
+        """Free a dispatch slot and hand it to the next eligible waiter"""
+        self._active -= 1
+        now = time.monotonic()
+        while self._heap and self._active < self.max_concurrency:
+            _, _, deadline, queued_at, future = heapq.heappop(self._heap)
+            if future.done():
+                continue
+            if deadline is not None and deadline <= now:
+                self._expired += 1
+                future.set_exception(DeadlineExceeded())
+                continue
+            self._grant(now - queued_at)
+            future.set_result(None)
+
+    def _grant(self, waited: float) -> None:
+        self._active += 1
+        self._dispatched += 1
+        self._total_wait += waited
+        self._max_wait = max(self._max_wait, waited)
+
+    @staticmethod
+    def _granted(future: asyncio.Future) -> bool:
+        return future.done() and not future.cancelled() and future.exception() is None
+
+    def stats(self) -> Dict[str, Any]:
+        """Return a snapshot of queue depth, throughput and wait times"""
+        by_priority: Dict[int, int] = {}
+        for neg_priority, _, _, _, future in self._heap:
+            if not future.done():
+                by_priority[-neg_priority] = by_priority.get(-neg_priority, 0) + 1
+        return {
+            'max_concurrency': self.max_concurrency,
+            'active': self._active,
+            'queued': sum(by_priority.values()),
+            'queued_by_priority': by_priority,
+            'dispatched': self._dispatched,
+            'expired': self._expired,
+            'avg_wait': self._total_wait / self._dispatched if self._dispatched else 0.0,
+            'max_wait': self._max_wait,
+        }
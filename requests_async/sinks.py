@@ -0,0 +1,340 @@
+"""
+Result sinks: stream bulk fetch results to disk as they arrive
+
+Used with :meth:`AsyncSession.fetch_many`. Fetchers hand results to a bounded
+queue; a single writer drains it in batches and writes them off the event loop,
+so memory stays bounded and slow disks push back on the fetchers.
+
+Example:
+    async with AsyncSession() as session:
+        stats = await session.fetch_many(urls, JSONLSink('out.jsonl'),
+                                         concurrency=50, checkpoint='out.ckpt')
+"""
+
+import asyncio
+import base64
+import hashlib
+import json
+import os
+from typing import Any, Collection, Dict, Iterable, List, Optional, Set, Union
+
+from .lightweight import LightResponse
+
+# Statuses worth retrying on a resumed run: timeouts, throttling, server errors
+DEFAULT_RETRY_STATUSES = frozenset({408, 429, *range(500, 600)})
+
+
+class FetchResult:
+    """One fetched URL: a LightResponse, or the error that prevented it"""
+
+    __slots__ = ('url', 'response', 'error')
+
+    def __init__(self, url: str, response: Optional[LightResponse] = None,
+                 error: Optional[str] = None):
+        self.url = url
+        self.response = response
+        self.error = error
+
+    def to_dict(self, include_body: bool = True) -> Dict[str, Any]:
+        """JSON-serialisable form; bodies that are not UTF-8 are base64 encoded"""
+        record: Dict[str, Any] = {'url': self.url}
+        if self.response is None:
+            record['error'] = self.error
+            return record
+        response = self.response
+        record.update(status=response.status_code, elapsed=response.elapsed,
+                      headers=response.headers)
+        if include_body:
+            try:
+                record['body'] = response.content.decode('utf-8')
+            except UnicodeDecodeError:
+                record['body_base64'] = base64.b64encode(response.content).decode('ascii')
+        return record
+
+
+class ResultSink:
+    """
+    Base class for result sinks
+
+    ``write_batch`` runs in a worker thread, one batch at a time, so
+    implementations may block on I/O and need no locking.
+    """
+
+    def open(self) -> None:
+        """Prepare for writing (called once, before the first batch)"""
+
+    def write_batch(self, results: List[FetchResult]) -> None:
+        raise NotImplementedError
+
+    def close(self) -> None:
+        """Flush and release resources"""
+
+    def __enter__(self):
+        self.open()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+class JSONLSink(ResultSink):
+    """
+    Append one JSON object per result to a file
+
+    Args:
+        path: Output file; appended to, so resumed runs extend it
+        include_body: Store response bodies (default: True)
+    """
+
+    def __init__(self, path: str, include_body: bool = True):
+        self.path = path
+        self.include_body = include_body
+        self._file = None
+
+    def open(self):
+        self._file = open(self.path, 'a', encoding='utf-8')
+
+    def write_batch(self, results):
+        self._file.write(''.join(
+            json.dumps(result.to_dict(self.include_body), ensure_ascii=False) + '\n'
+            for result in results
+        ))
+        self._file.flush()
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+class DirectorySink(ResultSink):
+    """
+    Write each body to its own file, plus an ``index.jsonl`` of metadata
+
+    Body files are named by the SHA-1 of the URL so reruns overwrite rather
+    than duplicate them.
+
+    Args:
+        path: Output directory; created if missing
+        extension: Suffix for body files (default: '')
+    """
+
+    def __init__(self, path: str, extension: str = ''):
+        self.path = path
+        self.extension = extension
+        self._index = None
+
+    def open(self):
+        os.makedirs(self.path, exist_ok=True)
+        self._index = open(os.path.join(self.path, 'index.jsonl'), 'a', encoding='utf-8')
+
+    def write_batch(self, results):
+        lines = []
+        for result in results:
+            record = result.to_dict(include_body=False)
+            if result.response is not None:
+                name = hashlib.sha1(result.url.encode()).hexdigest() + self.extension
+                with open(os.path.join(self.path, name), 'wb') as f:
+                    f.write(result.response.content)
+                record['file'] = name
+            lines.append(json.dumps(record, ensure_ascii=False) + '\n')
+        self._index.write(''.join(lines))
+        self._index.flush()
+
+    def close(self):
+        if self._index is not None:
+            self._index.close()
+            self._index = None
+
+
+class ParquetSink(ResultSink):
+    """
+    Write results as row groups of a Parquet file (requires pyarrow)
+
+    Columns: url, status, elapsed, error, headers (JSON text), body (binary).
+
+    Args:
+        path: Output file; a resumed run must use a new path, since Parquet
+              files cannot be appended to
+        include_body: Store response bodies (default: True)
+    """
+
+    def __init__(self, path: str, include_body: bool = True):
+        try:
+            import pyarrow
+            import pyarrow.parquet
+        except ImportError:
+            raise ImportError(
+                "ParquetSink requires pyarrow: pip install requests-async[parquet]"
+            ) from None
+        self._pa = pyarrow
+        self._pq = pyarrow.parquet
+        self.path = path
+        self.include_body = include_body
+        self._writer = None
+        self._schema = pyarrow.schema([
+            ('url', pyarrow.string()),
+            ('status', pyarrow.int32()),
+            ('elapsed', pyarrow.float64()),
+            ('error', pyarrow.string()),
+            ('headers', pyarrow.string()),
+            ('body', pyarrow.binary()),
+        ])
+
+    def open(self):
+        self._writer = self._pq.ParquetWriter(self.path, self._schema)
+
+    def write_batch(self, results):
+        columns: Dict[str, list] = {name: [] for name in self._schema.names}
+        for result in results:
+            response = result.response
+            columns['url'].append(result.url)
+            columns['error'].append(result.error)
+            columns['status'].append(response.status_code if response else None)
+            columns['elapsed'].append(response.elapsed if response else None)
+            columns['headers'].append(json.dumps(response.headers) if response else None)
+            columns['body'].append(response.content if response and self.include_body else None)
+        self._writer.write_table(self._pa.table(columns, schema=self._schema))
+
+    def close(self):
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+
+class Checkpoint:
+    """
+    Append-only file of completed URLs, used to skip them when a run resumes
+
+    Only results with a final response are recorded. URLs that failed with a
+    transport error or got a retryable status (408, 429 and 5xx by default)
+    are fetched again on the next run.
+
+    Args:
+        path: Checkpoint file; created if missing
+        retry_statuses: Statuses that are not recorded as done
+                        (default: DEFAULT_RETRY_STATUSES)
+    """
+
+    def __init__(self, path: str, retry_statuses: Optional[Collection[int]] = None):
+        self.path = path
+        self.retry_statuses = (DEFAULT_RETRY_STATUSES if retry_statuses is None
+                               else frozenset(retry_statuses))
+        self.done: Set[str] = set()
+        if os.path.exists(path):
+            with open(path, encoding='utf-8') as f:
+                self.done = {line.rstrip('\n') for line in f if line.strip()}
+        self._file = open(path, 'a', encoding='utf-8')
+
+    def record(self, results: Iterable[FetchResult]) -> None:
+        urls = [result.url for result in results
+                if result.response is not None
+                and result.response.status_code not in self.retry_statuses]
+        if urls:
+            self._file.write(''.join(url + '\n' for url in urls))
+            self._file.flush()
+            self.done.update(urls)
+
+    def close(self) -> None:
+        self._file.close()
+
+
+async def fetch_many(session, urls: Iterable[str], sink: ResultSink,
+                     method: str = 'GET',
+                     concurrency: int = 20,
+                     batch_size: int = 100,
+                     flush_interval: float = 1.0,
+                     buffer_size: Optional[int] = None,
+                     checkpoint: Union[str, Checkpoint, None] = None,
+                     **kwargs) -> Dict[str, int]:
+    """
+    Fetch ``urls`` with ``concurrency`` workers and stream results into ``sink``
+
+    See :meth:`AsyncSession.fetch_many`.
+    """
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue = asyncio.Queue(maxsize=buffer_size or batch_size * 2)
+    if isinstance(checkpoint, Checkpoint):
+        ckpt: Optional[Checkpoint] = checkpoint
+    else:
+        ckpt = Checkpoint(checkpoint) if checkpoint else None
+    stats = {'fetched': 0, 'errors': 0, 'skipped': 0, 'written': 0}
+    pending = iter(urls)
+    done_marker = object()
+
+    def next_url() -> Optional[str]:
+        for url in pending:
+            if ckpt is not None and url in ckpt.done:
+                stats['skipped'] += 1
+                continue
+            return url
+        return None
+
+    async def fetcher() -> None:
+        while True:
+            url = next_url()
+            if url is None:
+                return
+            try:
+                response = await session.request(method, url, lightweight=True, **kwargs)
+                result = FetchResult(url, response)
+                stats['fetched'] += 1
+            except Exception as exc:
+                result = FetchResult(url, error=f'{type(exc).__name__}: {exc}')
+                stats['errors'] += 1
+            # Blocks when the writer falls behind, throttling the fetchers
+            await queue.put(result)
+
+    def write(batch: List[FetchResult]) -> None:
+        sink.write_batch(batch)
+        if ckpt is not None:
+            ckpt.record(batch)
+
+    async def writer() -> None:
+        finished = False
+        while not finished:
+            batch: List[FetchResult] = []
+            deadline = loop.time() + flush_interval
+            while len(batch) < batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+                if item is done_marker:
+                    finished = True
+                    break
+                batch.append(item)
+            if batch:
+                await loop.run_in_executor(None, write, batch)
+                stats['written'] += len(batch)
+
+    await loop.run_in_executor(None, sink.open)
+    writer_task = asyncio.ensure_future(writer())
+    fetch_task = asyncio.ensure_future(
+        asyncio.gather(*(fetcher() for _ in range(concurrency)))
+    )
+    try:
+        await asyncio.wait({fetch_task, writer_task}, return_when=asyncio.FIRST_COMPLETED)
+        if writer_task.done():
+            # The writer only stops early on a sink error; don't leave fetchers blocked
+            fetch_task.cancel()
+            writer_task.result()
+        fetch_task.result()
+        await queue.put(done_marker)
+        await writer_task
+    finally:
+        tasks = (fetch_task, writer_task)
+        for task in tasks:
+            if not task.done():
+                task.cancel()
+        await asyncio.wait(tasks)
+        for task in tasks:
+            if not task.cancelled():
+                task.exception()  # mark retrieved; the first error was already raised
+        await loop.run_in_executor(None, sink.close)
+        if ckpt is not None:
+            ckpt.close()
+    return stats
@@ -0,0 +1,216 @@
+"""
+Synchronous facade running a pooled AsyncSession on a background event loop
+
+Example:
+    from requests_async import sync
+
+    with sync.Session() as session:
+        response = session.get('https://httpbin.org/get')
+        responses = session.map('GET', ['https://httpbin.org/get'] * 10)
+"""
+
+import asyncio
+import atexit
+import threading
+from typing import Any, Iterable, List, Optional
+
+from .client import AsyncSession, Response
+from .loops import new_event_loop
+from .pool import get_pool_limits, get_pools
+
+# map() concurrency when the pool size cannot be read (httpx's default limit)
+_DEFAULT_MAP_CONCURRENCY = 100
+
+
+class Session:
+    """
+    Thread-safe synchronous session
+
+    One event loop runs on a daemon thread for the lifetime of the session and
+    owns a single pooled :class:`AsyncSession`. Calls from any thread are
+    submitted to that loop, so connections are reused across calls and threads.
+
+    Args:
+        use_uvloop: Run the background loop on uvloop when installed
+        **kwargs: AsyncSession arguments (timeout, headers, proxies, ...)
+    """
+
+    def __init__(self, use_uvloop: bool = False, **kwargs):
+        self._loop = new_event_loop(use_uvloop)
+        self._thread = threading.Thread(
+            target=self._loop.run_forever, name='requests-async-sync', daemon=True
+        )
+        self._thread.start()
+        self._session = AsyncSession(**kwargs)
+        self._lock = threading.Lock()
+        self._closed = False
+        self._run(self._session.__aenter__())
+
+    def _run(self, coro) -> Any:
+        if threading.current_thread() is self._thread:
+            coro.close()
+            raise RuntimeError("Sync session called from its own event loop thread")
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result()
+
+    def request(self, method: str, url: str, **kwargs) -> Response:
+        """Send HTTP request and block until the response is read"""
+        if self._closed:
+            raise RuntimeError("Session is closed")
+        return self._run(self._session.request(method, url, **kwargs))
+
+    def get(self, url: str, **kwargs) -> Response:
+        """Send GET request"""
+        return self.request('GET', url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> Response:
+        """Send POST request"""
+        return self.request('POST', url, **kwargs)
+
+    def put(self, url: str, **kwargs) -> Response:
+        """Send PUT request"""
+        return self.request('PUT', url, **kwargs)
+
+    def delete(self, url: str, **kwargs) -> Response:
+        """Send DELETE request"""
+        return self.request('DELETE', url, **kwargs)
+
+    def patch(self, url: str, **kwargs) -> Response:
+        """Send PATCH request"""
+        return self.request('PATCH', url, **kwargs)
+
+    def head(self, url: str, **kwargs) -> Response:
+        """Send HEAD request"""
+        return self.request('HEAD', url, **kwargs)
+
+    def options(self, url: str, **kwargs) -> Response:
+        """Send OPTIONS request"""
+        return self.request('OPTIONS', url, **kwargs)
+
+    def map(self, method: str, urls: Iterable[str],
+            return_exceptions: bool = False,
+            concurrency: Optional[int] = None, **kwargs) -> List[Any]:
+        """
+        Send one request per URL concurrently and return responses in order
+
+        Args:
+            method: HTTP method used for every request
+            urls: URLs to request; consumed lazily
+            return_exceptions: Return exceptions in place of failed responses
+                               instead of raising the first one
+            concurrency: Requests in flight at once (default: the pool's
+                         max_connections), so long URL lists don't queue in
+                         the pool until they hit PoolTimeout
+            **kwargs: Request arguments applied to every request
+        """
+        if self._closed:
+            raise RuntimeError("Session is closed")
+        if concurrency is None:
+            concurrency = self._pool_size()
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+
+        async def _map():
+            pending = enumerate(urls)
+            results = {}
+
+            async def worker():
+                for index, url in pending:
+                    try:
+                        results[index] = await self._session.request(method, url, **kwargs)
+                    except Exception as exc:
+                        if not return_exceptions:
+                            raise
+                        results[index] = exc
+
+            workers = [asyncio.ensure_future(worker()) for _ in range(concurrency)]
+            try:
+                await asyncio.gather(*workers)
+            finally:
+                for task in workers:
+                    task.cancel()
+                await asyncio.gather(*workers, return_exceptions=True)
+            return [results[index] for index in range(len(results))]
+
+        return self._run(_map())
+
+    def _pool_size(self) -> int:
+        pools = get_pools(self._session._client)
+        limit = get_pool_limits(pools[0])['max_connections'] if pools else None
+        return limit or _DEFAULT_MAP_CONCURRENCY
+
+    def close(self) -> None:
+        """Close the pooled client and stop the background loop"""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+        try:
+            self._run(self._session.__aexit__(None, None, None))
+        finally:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join()
+            self._loop.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+_default_session: Optional[Session] = None
+_default_lock = threading.Lock()
+
+
+def _get_default_session() -> Session:
+    global _default_session
+    with _default_lock:
+        if _default_session is None:
+            _default_session = Session()
+            atexit.register(_default_session.close)
+        return _default_session
+
+
+def request(method: str, url: str, **kwargs) -> Response:
+    """
+    Send HTTP request through the shared process-wide sync session
+
+    Example:
+        response = requests_async.sync.request('GET', 'https://httpbin.org/get')
+    """
+    return _get_default_session().request(method, url, **kwargs)
+
+
+def get(url: str, **kwargs) -> Response:
+    """Send GET request"""
+    return request('GET', url, **kwargs)
+
+
+def post(url: str, **kwargs) -> Response:
+    """Send POST request"""
+    return request('POST', url, **kwargs)
+
+
+def put(url: str, **kwargs) -> Response:
+    """Send PUT request"""
+    return request('PUT', url, **kwargs)
+
+
+def delete(url: str, **kwargs) -> Response:
+    """Send DELETE request"""
+    return request('DELETE', url, **kwargs)
+
+
+def patch(url: str, **kwargs) -> Response:
+    """Send PATCH request"""
+    return request('PATCH', url, **kwargs)
+
+
+def head(url: str, **kwargs) -> Response:
+    """Send HEAD request"""
+    return request('HEAD', url, **kwargs)
+
+
+def options(url: str, **kwargs) -> Response:
+    """Send OPTIONS request"""
+    return request('OPTIONS', url, **kwargs)
@@ -0,0 +1,131 @@
+"""
+Precompiled request templates for hot call paths
+"""
+
+import string
+from typing import TYPE_CHECKING, Any, Dict, Optional
+from urllib.parse import quote
+
+import httpx
+from httpx import Response
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .client import AsyncSession
+
+
+class RequestTemplate:
+    """
+    A request shape prepared once and sent many times
+
+    Session headers, params, base URL and timeout are merged when the template
+    is created; each send only fills in path fields and any per-call extras,
+    then hands a ready ``httpx.Request`` to the client. Created with
+    :meth:`AsyncSession.prepare`.
+
+    Example:
+        get_user = session.prepare('GET', '/users/{user_id}', headers={'Accept': 'application/json'})
+        response = await get_user.send({'user_id': 42})
+    """
+
+    def __init__(self, session: 'AsyncSession', method: str, url_template: str,
+                 headers: Optional[Dict[str, str]] = None,
+                 params: Optional[Dict[str, Any]] = None,
+                 timeout: Any = httpx.USE_CLIENT_DEFAULT,
+                 follow_redirects: Optional[bool] = None):
+        client = session._require_client()
+        self._session = session
+        self.method = method.upper()
+        self.url_template = url_template
+        self._fields = {name for _, name, _, _ in string.Formatter().parse(url_template) if name}
+        # Same merge rules as httpx.AsyncClient.build_request, via public APIs only
+        self._headers = httpx.Headers(client.headers)
+        if headers:
+            self._headers.update(headers)
+        self._params = client.params.merge(params) if params else client.params
+        self._base_url = client.base_url
+        if timeout is httpx.USE_CLIENT_DEFAULT:
+            timeout = client.timeout
+        self._timeout = httpx.Timeout(timeout).as_dict()
+        self._follow_redirects = (
+            client.follow_redirects if follow_redirects is None else follow_redirects
+        )
+        # Templates without path fields resolve to one URL, built exactly once
+        self._url: Optional[httpx.URL] = None
+        if not self._fields:
+            self._url = self._build_url(url_template)
+
+    def _build_url(self, path: str) -> httpx.URL:
+        url = httpx.URL(path)
+        if url.is_relative_url:
+            # Relative paths extend base_url's path, as in httpx
+            base = self._base_url
+            url = base.copy_with(raw_path=base.raw_path + url.raw_path.lstrip(b'/'))
+        return url.copy_merge_params(self._params) if self._params else url
+
+    def build(self, path: Optional[Dict[str, Any]] = None,
+              params: Optional[Dict[str, Any]] = None,
+              headers: Optional[Dict[str, str]] = None,
+              timeout: Any = httpx.USE_CLIENT_DEFAULT,
+              **body) -> httpx.Request:
+        """
+        Return the ``httpx.Request`` for one call
+
+        Args:
+            path: Values for the ``{field}`` placeholders; URL-quoted
+            params: Extra query parameters for this call
+            headers: Extra headers for this call
+            timeout: Timeout override for this call
+            **body: ``content``, ``data``, ``files`` or ``json``
+        """
+        if self._url is not None:
+            url = self._url
+        else:
+            path = path or {}
+            missing = self._fields - set(path)
+            if missing:
+                raise KeyError(f"Missing path fields for {self.url_template!r}: {sorted(missing)}")
+            url = self._build_url(self.url_template.format(
+                **{name: quote(str(value), safe='') for name, value in path.items()}
+            ))
+        if params:
+            url = url.copy_merge_params(params)
+        if headers:
+            merged = httpx.Headers(self._headers)
+            merged.update(headers)
+        else:
+            merged = self._headers
+        if timeout is httpx.USE_CLIENT_DEFAULT:
+            timeout_dict = self._timeout
+        else:
+            timeout_dict = httpx.Timeout(timeout).as_dict()
+        request = httpx.Request(self.method, url, headers=merged,
+                                extensions={'timeout': timeout_dict}, **body)
+        cookies = self._session._client.cookies
+        if cookies:
+            cookies.set_cookie_header(request)
+        return request
+
+    async def send(self, path: Optional[Dict[str, Any]] = None,
+                   priority: int = 0,
+                   deadline: Optional[float] = None,
+                   lightweight: Optional[bool] = None,
+                   **kwargs) -> Response:
+        """
+        Fill in the variable parts and send the request
+
+        Args:
+            path: Values for the ``{field}`` placeholders
+            priority: Queue priority, as for :meth:`AsyncSession.request`
+            deadline: Dispatch deadline in seconds, as for :meth:`AsyncSession.request`
+            lightweight: Return a LightResponse, as for :meth:`AsyncSession.request`
+            **kwargs: ``params``, ``headers``, ``timeout`` and body arguments for :meth:`build`
+        """
+        request = self.build(path, **kwargs)
+        client = self._session._require_client()
+        return await self._session._dispatch(
+            lambda: client.send(request, follow_redirects=self._follow_redirects),
+            priority, deadline, lightweight,
+        )
+
+    def __repr__(self) -> str:
+        return f"<RequestTemplate {self.method} {self.url_template!r}>"
@@ -0,0 +1,141 @@
+"""
+Process-wide SSL context cache with TLS session resumption
+"""
+
+import os
+import ssl
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple, Union
+
+import certifi
+
+CertTypes = Union[str, Tuple[str, str], Tuple[str, str, str]]
+VerifyTypes = Union[bool, str, ssl.SSLContext]
+
+_MAX_RESUMABLE_HOSTS = 256
+
+
+class ResumingSSLContext(ssl.SSLContext):
+    """
+    Client SSLContext that resumes the previous TLS session per host
+
+    The stdlib only resumes a session when it is passed explicitly to
+    ``wrap_bio``/``wrap_socket``. This context remembers the last connection
+    to each server name and offers its session (or TLS 1.3 ticket) on the
+    next handshake, so reconnects skip the full key exchange.
+    """
+
+    def __new__(cls, *args, **kwargs):
+        context = super().__new__(cls, *args, **kwargs)
+        context._last_connections = OrderedDict()
+        context._resume_lock = threading.Lock()
+        return context
+
+    def wrap_bio(self, incoming, outgoing, server_side=False, server_hostname=None,
+                 session=None):
+        key = None if server_side else server_hostname
+        if session is None and key is not None:
+            session = self._cached_session(key)
+        try:
+            sslobj = super().wrap_bio(incoming, outgoing, server_side=server_side,
+                                      server_hostname=server_hostname, session=session)
+        except ValueError:
+            # Stale or foreign session; fall back to a full handshake
+            sslobj = super().wrap_bio(incoming, outgoing, server_side=server_side,
+                                      server_hostname=server_hostname)
+        if key is not None:
+            with self._resume_lock:
+                self._last_connections[key] = sslobj
+                self._last_connections.move_to_end(key)
+                while len(self._last_connections) > _MAX_RESUMABLE_HOSTS:
+                    self._last_connections.popitem(last=False)
+        return sslobj
+
+    def _cached_session(self, server_hostname: str) -> Optional[ssl.SSLSession]:
+        with self._resume_lock:
+            previous = self._last_connections.get(server_hostname)
+        if previous is None:
+            return None
+        try:
+            return previous.session
+        except (ValueError, ssl.SSLError):
+            return None
+
+
+_cache: Dict[tuple, ssl.SSLContext] = {}
+_cache_lock = threading.Lock()
+
+
+def _build_context(verify: Union[bool, str], cert: Optional[CertTypes], trust_env: bool,
+                   http2: bool, ciphers: Optional[str]) -> ssl.SSLContext:
+    context = ResumingSSLContext(ssl.PROTOCOL_TLS_CLIENT)
+    context.minimum_version = ssl.TLSVersion.TLSv1_2
+    if verify is False:
+        context.check_hostname = False
+        context.verify_mode = ssl.CERT_NONE
+    else:
+        if isinstance(verify, str):
+            ca_path = verify
+        elif trust_env and os.environ.get('SSL_CERT_FILE'):
+            ca_path = os.environ['SSL_CERT_FILE']
+        elif trust_env and os.environ.get('SSL_CERT_DIR'):
+            ca_path = os.environ['SSL_CERT_DIR']
+        else:
+            ca_path = certifi.where()
+        if os.path.isdir(ca_path):
+            context.load_verify_locations(capath=ca_path)
+        else:
+            context.load_verify_locations(cafile=ca_path)
+    if cert is not None:
+        if isinstance(cert, str):
+            context.load_cert_chain(certfile=cert)
+        else:
+            context.load_cert_chain(*cert)
+    if ciphers:
+        context.set_ciphers(ciphers)
+    context.set_alpn_protocols(['http/1.1', 'h2'] if http2 else ['http/1.1'])
+    if trust_env and os.environ.get('SSLKEYLOGFILE'):
+        context.keylog_filename = os.environ['SSLKEYLOGFILE']
+    return context
+
+
+def get_ssl_context(verify: VerifyTypes = True,
+                    cert: Optional[CertTypes] = None,
+                    trust_env: bool = True,
+                    http2: bool = False,
+                    ciphers: Optional[str] = None) -> ssl.SSLContext:
+    """
+    Return a shared SSLContext for the given settings
+
+    Contexts are built once per distinct combination of settings (including
+    the ``SSL_CERT_FILE``/``SSL_CERT_DIR`` environment when ``trust_env`` is
+    set) and reused by every session in the process. A caller-supplied
+    SSLContext is returned unchanged.
+
+    Args:
+        verify: True for the certifi bundle, False to disable verification,
+                or a path to a CA bundle file or directory
+        cert: Client certificate file, or (certfile, keyfile[, password])
+        trust_env: Honour SSL_CERT_FILE, SSL_CERT_DIR and SSLKEYLOGFILE
+        http2: Advertise HTTP/2 via ALPN
+        ciphers: OpenSSL cipher string
+    """
+    if isinstance(verify, ssl.SSLContext):
+        return verify
+    env = (
+        os.environ.get('SSL_CERT_FILE'), os.environ.get('SSL_CERT_DIR'),
+        os.environ.get('SSLKEYLOGFILE'),
+    ) if trust_env else None
+    key = (verify, cert, trust_env, http2, ciphers, env)
+    with _cache_lock:
+        context = _cache.get(key)
+        if context is None:
+            context = _cache[key] = _build_context(verify, cert, trust_env, http2, ciphers)
+        return context
+
+
+def clear_ssl_context_cache() -> None:
+    """Drop all cached contexts, e.g. after rotating certificates on disk"""
+    with _cache_lock:
+        _cache.clear()
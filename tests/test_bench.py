@@ -0,0 +1,89 @@
+"""
+Load generator tests for requests-async (offline, against a local server)
+"""
+
+import asyncio
+import json
+import threading
+
+import pytest
+from requests_async import bench
+
+RESPONSES = {
+    b'/ok': b"HTTP/1.1 200 OK\r\nContent-Length: 2\r\n\r\nok",
+    b'/missing': b"HTTP/1.1 404 Not Found\r\nContent-Length: 0\r\n\r\n",
+}
+
+
+async def _handle(reader, writer):
+    try:
+        while True:
+            head = await reader.readuntil(b"\r\n\r\n")
+            path = head.split(b' ', 2)[1]
+            length = 0
+            for line in head.split(b"\r\n"):
+                if line.lower().startswith(b'content-length:'):
+                    length = int(line.split(b':')[1])
+            if length:
+                await reader.readexactly(length)
+            writer.write(RESPONSES.get(path, RESPONSES[b'/missing']))
+            await writer.drain()
+    except (asyncio.IncompleteReadError, ConnectionResetError):
+        pass
+    finally:
+        writer.close()
+
+
+@pytest.fixture(scope='module')
+def server_url():
+    loop = asyncio.new_event_loop()
+    server = loop.run_until_complete(asyncio.start_server(_handle, '127.0.0.1', 0))
+    port = server.sockets[0].getsockname()[1]
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+    yield f'http://127.0.0.1:{port}'
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join()
+
+
+def test_closed_loop_json_report(server_url, capsys):
+    """Test fixed-concurrency mode reports throughput, percentiles and statuses"""
+    assert bench.main([f'{server_url}/ok', '-c', '4', '-n', '40', '--warmup', '4', '--json']) == 0
+    report = json.loads(capsys.readouterr().out)
+    assert report['requests'] == 40
+    assert report['status_codes'] == {'200': 40}
+    assert report['throughput'] > 0
+    assert report['latency_ms']['p50'] <= report['latency_ms']['p99'] <= report['latency_ms']['max']
+
+
+def test_open_loop_requests_file(server_url, tmp_path, capsys):
+    """Test fixed-rate mode replaying a mixed requests file"""
+    requests_file = tmp_path / 'requests.jsonl'
+    requests_file.write_text(
+        f'{server_url}/ok\n'
+        f'POST {server_url}/missing\n'
+        + json.dumps({'method': 'POST', 'url': f'{server_url}/ok', 'body': 'x'}) + '\n'
+    )
+    bench.main(['-f', str(requests_file), '--rate', '200', '-n', '30'])
+    out = capsys.readouterr().out
+    assert 'open-loop, rate=200/s' in out
+    assert '200: 20' in out
+    assert '404: 10' in out
+
+
+def test_errors_are_counted():
+    """Test connection failures show up in the error breakdown"""
+    args = bench.build_parser().parse_args(['http://127.0.0.1:1/', '-c', '2', '-n', '4',
+                                            '--timeout', '1'])
+    report = asyncio.run(bench.run(args)).summary()
+    assert report['errors'] == {'ConnectError': 4}
+    assert report['status_codes'] == {}
+
+
+def test_percentile():
+    """Test nearest-rank percentiles"""
+    values = list(range(1, 101))
+    assert bench.percentile(values, 50) == 50
+    assert bench.percentile(values, 99) == 99
+    assert bench.percentile(values, 100) == 100
+    assert bench.percentile([], 50) == 0.0
@@ -0,0 +1,56 @@
+"""
+Import-time tests for requests-async
+"""
+
+import subprocess
+import sys
+
+import pytest
+
+
+def _run(code):
+    result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True,
+                            check=True)
+    return result.stdout.strip()
+
+
+def test_import_is_lazy():
+    """Test importing the package does not load httpx or optional transports"""
+    loaded = _run(
+        "import sys, requests_async; "
+        "print(sorted(m for m in ('httpx', 'ssl', 'multiprocessing', 'socksio', 'h2', 'uvloop') "
+        "if m in sys.modules))"
+    )
+    assert loaded == '[]'
+
+
+def test_plain_session_skips_socks_and_http2():
+    """Test SOCKS and HTTP/2 support load only when configured"""
+    loaded = _run(
+        "import sys, requests_async; requests_async.AsyncSession(); "
+        "print(sorted(m for m in ('socksio', 'h2') if m in sys.modules))"
+    )
+    assert loaded == '[]'
+
+
+def test_lazy_attributes_resolve():
+    """Test public names resolve on first access"""
+    import httpx
+    import requests_async
+    assert requests_async.Response is httpx.Response
+    assert requests_async.AsyncSession.__module__ == 'requests_async.client'
+    assert callable(requests_async.sync.get)
+    assert 'AsyncSession' in dir(requests_async)
+    with pytest.raises(AttributeError):
+        requests_async.does_not_exist
+
+
+def test_import_time_budget():
+    """Test the bare import stays well under the cost of importing httpx"""
+    timings = _run(
+        "import time; t = time.perf_counter(); import requests_async; "
+        "a = time.perf_counter() - t; t = time.perf_counter(); import httpx; "
+        "print(a, time.perf_counter() - t)"
+    )
+    package_time, httpx_time = map(float, timings.split())
+    assert package_time < httpx_time
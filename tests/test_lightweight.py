@@ -0,0 +1,73 @@
+"""
+Lightweight response tests for requests-async (offline, using httpx.MockTransport)
+"""
+
+import pickle
+
+import httpx
+import pytest
+import requests_async
+
+
+def _handler(request):
+    if request.url.path == '/missing':
+        return httpx.Response(404, text='nope')
+    return httpx.Response(200, json={'ok': True, 'name': 'café'},
+                          headers={'ETag': '"v1"', 'X-Noise': 'x' * 100})
+
+
+def _session(**kwargs):
+    return requests_async.AsyncSession(transport=httpx.MockTransport(_handler), **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_lightweight_session():
+    """Test sessions can return compact responses with selected headers"""
+    async with _session(lightweight=True, keep_headers=('Content-Type', 'ETag')) as session:
+        response = await session.get('https://api.test/item')
+
+    assert isinstance(response, requests_async.LightResponse)
+    assert not hasattr(response, '__dict__')
+    assert response.status_code == 200
+    assert response.url == 'https://api.test/item'
+    assert response.headers == {'content-type': 'application/json', 'etag': '"v1"'}
+    assert response.json() == {'ok': True, 'name': 'café'}
+    assert 'café' in response.text
+    assert bytes(response.view()) == response.content
+    assert response.elapsed >= 0
+
+
+@pytest.mark.asyncio
+async def test_lightweight_per_request_override():
+    """Test the per-request flag overrides the session setting either way"""
+    async with _session() as session:
+        assert isinstance(await session.get('https://api.test/', lightweight=True),
+                          requests_async.LightResponse)
+        assert isinstance(await session.get('https://api.test/'), httpx.Response)
+    async with _session(lightweight=True) as session:
+        assert isinstance(await session.get('https://api.test/', lightweight=False),
+                          httpx.Response)
+        template = session.prepare('GET', 'https://api.test/')
+        assert isinstance(await template.send(), requests_async.LightResponse)
+
+
+@pytest.mark.asyncio
+async def test_lightweight_raise_for_status():
+    """Test 4xx responses raise HTTPStatusError"""
+    async with _session(lightweight=True) as session:
+        response = await session.get('https://api.test/missing')
+    assert response.text == 'nope'
+    with pytest.raises(httpx.HTTPStatusError):
+        response.raise_for_status()
+
+
+@pytest.mark.asyncio
+async def test_lightweight_pickles_compactly():
+    """Test light responses pickle much smaller than full responses"""
+    async with _session() as session:
+        full = await session.get('https://api.test/item')
+    light = requests_async.LightResponse.from_response(full)
+    restored = pickle.loads(pickle.dumps(light))
+    assert restored.json() == light.json()
+    assert restored.headers == light.headers
+    assert len(pickle.dumps(light)) * 3 < len(pickle.dumps(full))
@@ -0,0 +1,66 @@
+"""
+Event loop and session registry tests for requests-async (offline, using httpx.MockTransport)
+"""
+
+import asyncio
+
+import httpx
+import pytest
+import requests_async
+from requests_async import loops
+
+
+def _transport():
+    return httpx.MockTransport(lambda request: httpx.Response(200, text='ok'))
+
+
+def test_registry_one_session_per_loop():
+    """Test each loop gets its own session, closed when the loop shuts down"""
+    registry = requests_async.SessionRegistry(transport=_transport())
+
+    async def use():
+        first = await registry.get()
+        second = await registry.get()
+        assert first is second
+        assert (await first.get('https://api.test/')).text == 'ok'
+        return first
+
+    session_a = asyncio.run(use())
+    session_b = loops.run(use())
+    assert session_a is not session_b
+    assert session_a._client.is_closed
+    assert session_b._client.is_closed
+    assert registry.stats() == {'sessions': 0}
+
+
+@pytest.mark.asyncio
+async def test_registry_aclose():
+    """Test a loop's session can be closed early"""
+    registry = requests_async.SessionRegistry(transport=_transport())
+    session = await registry.get()
+    await registry.aclose()
+    assert session._client.is_closed
+    assert registry.stats() == {'sessions': 0}
+
+
+def test_session_rejects_other_loop():
+    """Test reusing a session on another loop fails with a clear error"""
+    async def open_session():
+        session = requests_async.AsyncSession(transport=_transport())
+        await session.__aenter__()
+        return session
+
+    session = asyncio.run(open_session())
+    with pytest.raises(RuntimeError, match='different event loop'):
+        asyncio.run(session.get('https://api.test/'))
+
+
+def test_new_event_loop_fallback():
+    """Test uvloop opt-in falls back to the stdlib loop when not installed"""
+    loop = loops.new_event_loop(use_uvloop=True)
+    try:
+        if not loops.uvloop_available():
+            assert isinstance(loop, asyncio.AbstractEventLoop)
+        assert loops.run(asyncio.sleep(0, 'done'), use_uvloop=True) == 'done'
+    finally:
+        loop.close()
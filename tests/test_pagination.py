@@ -0,0 +1,116 @@
+"""
+Pagination tests for requests-async (offline, using httpx.MockTransport)
+"""
+
+import httpx
+import pytest
+import requests_async
+
+
+def _session(handler):
+    return requests_async.AsyncSession(transport=httpx.MockTransport(handler))
+
+
+@pytest.mark.asyncio
+async def test_link_header_pagination():
+    """Test following rel="next" Link headers"""
+    def handler(request):
+        page = int(request.url.params.get('page', '1'))
+        headers = {}
+        if page < 3:
+            headers['Link'] = f'</items?page={page + 1}>; rel="next"'
+        return httpx.Response(200, json=[page * 10, page * 10 + 1], headers=headers)
+
+    async with _session(handler) as session:
+        items = [item async for item in session.paginate('https://api.test/items')]
+    assert items == [10, 11, 20, 21, 30, 31]
+
+
+@pytest.mark.asyncio
+async def test_cursor_pagination():
+    """Test cursor taken from the JSON body"""
+    pages = {None: ('a', [1, 2]), 'a': ('b', [3]), 'b': (None, [4])}
+
+    def handler(request):
+        cursor = request.url.params.get('cursor')
+        next_cursor, items = pages[cursor]
+        assert request.url.params['q'] == 'x'
+        return httpx.Response(200, json={'data': {'items': items}, 'next': next_cursor})
+
+    strategy = requests_async.CursorPagination(next_cursor='next', items_key='data.items')
+    async with _session(handler) as session:
+        items = [i async for i in session.paginate('https://api.test/', strategy=strategy,
+                                                   params={'q': 'x'})]
+    assert items == [1, 2, 3, 4]
+
+
+@pytest.mark.asyncio
+async def test_offset_pagination_prefetches():
+    """Test offset pages are requested ahead and stop at a short page"""
+    requested = []
+
+    def handler(request):
+        offset = int(request.url.params['offset'])
+        requested.append(offset)
+        data = list(range(offset, min(offset + 2, 5)))
+        return httpx.Response(200, json=data)
+
+    strategy = requests_async.OffsetPagination(limit=2)
+    async with _session(handler) as session:
+        items = [i async for i in session.paginate('https://api.test/', strategy=strategy,
+                                                   prefetch=3)]
+    assert items == [0, 1, 2, 3, 4]
+    assert requested[:4] == [0, 2, 4, 6]
+
+
+@pytest.mark.asyncio
+async def test_page_number_pagination_max_pages():
+    """Test page-number strategy honours max_pages"""
+    def handler(request):
+        page = int(request.url.params['page'])
+        return httpx.Response(200, json={'results': [page]})
+
+    strategy = requests_async.PageNumberPagination(items_key='results')
+    async with _session(handler) as session:
+        items = [i async for i in session.paginate('https://api.test/', strategy=strategy,
+                                                   max_pages=3)]
+    assert items == [1, 2, 3]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('total', [25, 30])
+async def test_page_number_pagination_stops_at_end(total):
+    """Test the page size is inferred and a 404 past the last page ends iteration"""
+    def handler(request):
+        page = int(request.url.params['page'])
+        items = list(range(total))[(page - 1) * 10:page * 10]
+        return httpx.Response(200, json=items) if items else httpx.Response(404)
+
+    async with _session(handler) as session:
+        items = [i async for i in session.paginate('https://api.test/', strategy='page')]
+        assert items == list(range(total))
+        # A 404 on the first page is still an error
+        with pytest.raises(httpx.HTTPStatusError):
+            strategy = requests_async.PageNumberPagination(start=9)
+            [i async for i in session.paginate('https://api.test/', strategy=strategy)]
+
+
+@pytest.mark.asyncio
+async def test_object_body_requires_items_key():
+    """Test an object page without items_key raises instead of yielding its keys"""
+    def handler(request):
+        return httpx.Response(200, json={'total_count': 2, 'items': [1, 2]})
+
+    async with _session(handler) as session:
+        with pytest.raises(TypeError, match='items_key'):
+            [item async for item in session.paginate('https://api.test/search')]
+        strategy = requests_async.LinkHeaderPagination(items_key='items')
+        items = [item async for item in session.paginate('https://api.test/search',
+                                                         strategy=strategy)]
+    assert items == [1, 2]
+
+
+def test_unknown_strategy():
+    """Test unknown strategy names are rejected"""
+    with pytest.raises(ValueError):
+        requests_async.AsyncSession().paginate('https://api.test/', strategy='bogus')
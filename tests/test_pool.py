@@ -0,0 +1,110 @@
+"""
+Connection pool introspection and auto-tuning tests (offline, against a local server)
+"""
+
+import asyncio
+
+import httpx
+import pytest
+from requests_async import AsyncSession, PoolAutoTuner
+
+
+async def _handle(reader, writer):
+    try:
+        while True:
+            head = await reader.readuntil(b"\r\n\r\n")
+            if head.split(b' ', 2)[1] == b'/slow':
+                await asyncio.sleep(0.05)
+            writer.write(b"HTTP/1.1 200 OK\r\nContent-Length: 2\r\n\r\nok")
+            await writer.drain()
+    except (asyncio.IncompleteReadError, ConnectionResetError):
+        pass
+    finally:
+        writer.close()
+
+
+async def _start_server():
+    server = await asyncio.start_server(_handle, '127.0.0.1', 0)
+    port = server.sockets[0].getsockname()[1]
+    return server, f'http://127.0.0.1:{port}'
+
+
+@pytest.mark.asyncio
+async def test_pool_stats_without_metrics():
+    """Test pool_stats reports limits and idle connections per origin"""
+    server, url = await _start_server()
+    async with server:
+        limits = httpx.Limits(max_connections=7, max_keepalive_connections=3)
+        async with AsyncSession(limits=limits) as session:
+            await asyncio.gather(*(session.get(f'{url}/ok') for _ in range(3)))
+            stats = session.pool_stats()
+    assert stats['limits'] == {'max_connections': 7, 'max_keepalive_connections': 3}
+    assert stats['queued'] == 0
+    assert stats['origins'][url]['idle'] >= 1
+    assert stats['origins'][url]['active'] == 0
+    assert 'reuse_ratio' not in stats
+
+
+@pytest.mark.asyncio
+async def test_pool_metrics_reuse_and_wait():
+    """Test pool_metrics separates pool wait from upstream latency and counts reuse"""
+    server, url = await _start_server()
+    async with server:
+        limits = httpx.Limits(max_connections=2)
+        async with AsyncSession(limits=limits, pool_metrics=True) as session:
+            # 6 slow requests over 2 connections: most wait for a connection
+            await asyncio.gather(*(session.get(f'{url}/slow') for _ in range(6)))
+            stats = session.pool_stats()
+    origin = stats['origins'][url]
+    assert origin['requests'] == stats['requests'] == 6
+    assert origin['new_connections'] == 2
+    assert stats['reuse_ratio'] == pytest.approx(4 / 6)
+    assert stats['avg_latency'] >= 0.04
+    assert stats['max_wait'] >= 0.08
+    assert stats['tuning'] is None
+
+
+@pytest.mark.asyncio
+async def test_pool_metrics_chain_user_trace():
+    """Test a caller's trace extension still receives events"""
+    server, url = await _start_server()
+    events = []
+
+    async def trace(name, info):
+        events.append(name)
+
+    async with server:
+        async with AsyncSession(pool_metrics=True) as session:
+            await session.get(f'{url}/ok', extensions={'trace': trace})
+            assert session.pool_stats()['requests'] == 1
+    assert 'http11.receive_response_headers.complete' in events
+
+
+@pytest.mark.asyncio
+async def test_auto_tune_grows_pool_under_wait():
+    """Test auto_tune raises max_connections when requests queue for connections"""
+    server, url = await _start_server()
+    tuner = PoolAutoTuner(min_connections=2, max_connections=16, interval=0.0, min_samples=8)
+    async with server:
+        limits = httpx.Limits(max_connections=2)
+        async with AsyncSession(limits=limits, auto_tune=tuner) as session:
+            await asyncio.gather(*(session.get(f'{url}/slow') for _ in range(8)))
+            stats = session.pool_stats()
+    assert stats['tuning']['adjustments'] == 1
+    assert stats['tuning']['last_reason'] == 'pool wait'
+    assert stats['limits']['max_connections'] == stats['tuning']['max_connections'] == 3
+
+
+def test_tuner_decisions():
+    """Test the tuner shrinks on upstream saturation and idle capacity"""
+    tuner = PoolAutoTuner(min_connections=4, max_connections=100)
+    assert tuner.decide(40, [0.0] * 10, [0.1] * 10, peak_demand=30) == 40
+    # Pool wait with latency 3x baseline: the upstream is the bottleneck
+    assert tuner.decide(40, [0.5] * 10, [0.3] * 10, peak_demand=60) == 26
+    assert tuner.last_reason == 'upstream latency rising'
+    # Pool wait at normal latency: grow
+    assert tuner.decide(26, [0.5] * 10, [0.1] * 10, peak_demand=60) == 39
+    # No wait and little demand: shrink towards twice the peak, within bounds
+    assert tuner.decide(39, [0.0] * 10, [0.1] * 10, peak_demand=1) == 26
+    assert tuner.decide(6, [0.0] * 10, [0.1] * 10, peak_demand=1) == 4
+    assert tuner.last_reason == 'idle capacity'
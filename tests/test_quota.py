@@ -0,0 +1,207 @@
+"""
+Quota backend tests for requests-async (offline; Redis via a local stand-in server)
+"""
+
+import asyncio
+import fcntl
+import multiprocessing
+import os
+import threading
+import time
+
+import pytest
+from requests_async import RateLimiter
+from requests_async.quota import (
+    FileLockQuotaBackend, LocalQuotaBackend, QuotaBackend, RedisError,
+    RedisQuotaBackend, take_from_bucket,
+)
+
+
+class CountingBackend(QuotaBackend):
+    def __init__(self, inner):
+        self.inner = inner
+        self.calls = 0
+
+    async def take(self, count, rate, burst):
+        self.calls += 1
+        return await self.inner.take(count, rate, burst)
+
+
+def test_take_from_bucket():
+    """Test whole-token grants, refill and retry delay"""
+    tokens, updated, granted, retry = take_from_bucket(5.0, 0.0, 0.0, 3, rate=10, burst=5)
+    assert (tokens, granted, retry) == (2.0, 3, 0.0)
+    tokens, updated, granted, retry = take_from_bucket(tokens, updated, 0.0, 3, rate=10, burst=5)
+    assert (granted, tokens) == (2, 0.0)
+    tokens, updated, granted, retry = take_from_bucket(tokens, updated, 0.05, 3, rate=10, burst=5)
+    assert granted == 0 and retry == pytest.approx(0.05)
+
+
+@pytest.mark.asyncio
+async def test_leasing_reduces_backend_calls():
+    """Test tokens are leased in batches from the backend"""
+    backend = CountingBackend(LocalQuotaBackend())
+    limiter = RateLimiter(rate=1000, backend=backend, lease_size=10)
+    for _ in range(50):
+        await limiter.acquire()
+    assert backend.calls == 5
+
+
+def test_default_lease_size():
+    """Test shared backends lease in batches by default, the local one per request"""
+    assert RateLimiter(1000).lease_size == 1
+    assert RateLimiter(1000, backend=CountingBackend(LocalQuotaBackend())).lease_size == 50
+    assert RateLimiter(10, backend=CountingBackend(LocalQuotaBackend())).lease_size == 1
+
+
+@pytest.mark.asyncio
+async def test_file_lock_backend_does_not_block_loop(tmp_path):
+    """Test waiting for another holder's flock leaves the event loop running"""
+    path = str(tmp_path / 'quota')
+    backend = FileLockQuotaBackend(path)
+    holder = os.open(path, os.O_RDWR | os.O_CREAT)
+    fcntl.flock(holder, fcntl.LOCK_EX)
+    ticks = 0
+
+    async def tick():
+        nonlocal ticks
+        while True:
+            ticks += 1
+            await asyncio.sleep(0.01)
+
+    ticker = asyncio.ensure_future(tick())
+    # Release from a thread so a blocked loop shows up as a failure, not a hang
+    threading.Timer(0.1, fcntl.flock, (holder, fcntl.LOCK_UN)).start()
+    try:
+        assert (await backend.take(1, rate=10, burst=1))[0] == 1
+    finally:
+        ticker.cancel()
+        os.close(holder)
+        await backend.aclose()
+    assert ticks >= 5
+
+
+def _hammer_file(path, count, barrier, results):
+    async def main():
+        limiter = RateLimiter(rate=20, burst=1, backend=FileLockQuotaBackend(path))
+        barrier.wait()
+        start = time.monotonic()
+        for _ in range(count):
+            await limiter.acquire()
+        results.put((start, time.monotonic()))
+    asyncio.run(main())
+
+
+def test_file_lock_backend_shared_between_processes(tmp_path):
+    """Test unrelated processes pointing at one file share a single quota"""
+    context = multiprocessing.get_context('spawn')
+    results = context.Queue()
+    barrier = context.Barrier(2)
+    path = str(tmp_path / 'quota.bin')
+    processes = [context.Process(target=_hammer_file, args=(path, 6, barrier, results))
+                 for _ in range(2)]
+    for process in processes:
+        process.start()
+    spans = [results.get(timeout=30) for _ in processes]
+    for process in processes:
+        process.join(30)
+    elapsed = max(end for _, end in spans) - min(start for start, _ in spans)
+    # 12 tokens at 20/s from one bucket need >= 0.55s; two private buckets would need 0.25s
+    assert elapsed >= 0.5
+
+
+async def _serve_redis(store, reader, writer):
+    try:
+        while True:
+            header = await reader.readline()
+            if not header:
+                break
+            args = []
+            for _ in range(int(header[1:])):
+                length = int((await reader.readline())[1:])
+                args.append((await reader.readexactly(length + 2))[:-2].decode())
+            command = args[0].upper()
+            if command == 'AUTH' and args[-1] != 'secret':
+                writer.write(b'-WRONGPASS invalid password\r\n')
+            elif command == 'INCRBY' and args[1].startswith('bad'):
+                writer.write(b'-WRONGTYPE Operation against a key holding the wrong kind\r\n')
+            elif command == 'INCRBY':
+                store[args[1]] = store.get(args[1], 0) + int(args[2])
+                writer.write(b':%d\r\n' % store[args[1]])
+            elif command in ('PEXPIRE', 'SELECT', 'AUTH'):
+                writer.write(b':1\r\n' if command == 'PEXPIRE' else b'+OK\r\n')
+            else:
+                writer.write(b'-ERR unknown command\r\n')
+            await writer.drain()
+    finally:
+        writer.close()
+
+
+@pytest.mark.asyncio
+async def test_redis_backend_fixed_window():
+    """Test the Redis backend leases from a shared per-window counter"""
+    store = {}
+    server = await asyncio.start_server(lambda r, w: _serve_redis(store, r, w), '127.0.0.1', 0)
+    port = server.sockets[0].getsockname()[1]
+    url = f'redis://:secret@127.0.0.1:{port}/2'
+    try:
+        node_a = RedisQuotaBackend(url, key='api', window=60)
+        node_b = RedisQuotaBackend(url, key='api', window=60)
+        # rate * window = 30 requests per window shared by both nodes
+        assert await node_a.take(20, 0.5, 1) == (20, 0.0)
+        granted, retry = await node_b.take(20, 0.5, 1)
+        assert granted == 10
+        granted, retry = await node_a.take(5, 0.5, 1)
+        assert granted == 0 and 0 < retry <= 60
+        assert list(store.values()) == [45]
+
+        with pytest.raises(RedisError):
+            await node_a.execute(('FLUSHALL',))
+        await node_a.aclose()
+        await node_b.aclose()
+    finally:
+        server.close()
+        await server.wait_closed()
+
+
+@pytest.mark.asyncio
+async def test_redis_backend_error_reply_keeps_pipeline_in_sync():
+    """Test an error reply mid-pipeline does not shift later replies"""
+    store = {}
+    server = await asyncio.start_server(lambda r, w: _serve_redis(store, r, w), '127.0.0.1', 0)
+    port = server.sockets[0].getsockname()[1]
+    try:
+        backend = RedisQuotaBackend(f'redis://127.0.0.1:{port}', key='api', window=60)
+        with pytest.raises(RedisError, match='WRONGTYPE'):
+            await backend.execute(('INCRBY', 'bad', 1), ('PEXPIRE', 'bad', 5))
+        assert await backend.execute(('INCRBY', 'n', 2), ('PEXPIRE', 'n', 5)) == [2, 1]
+        # 30 per window: a desynced pipeline would keep granting everything
+        assert (await backend.take(20, 0.5, 1))[0] == 20
+        assert (await backend.take(20, 0.5, 1))[0] == 10
+        await backend.aclose()
+
+        wrong = RedisQuotaBackend(f'redis://:nope@127.0.0.1:{port}', key='api')
+        with pytest.raises(RedisError, match='WRONGPASS'):
+            await wrong.take(1, 1, 1)
+        assert wrong._conn is None
+    finally:
+        server.close()
+        await server.wait_closed()
+
+
+@pytest.mark.asyncio
+async def test_redis_backend_with_limiter():
+    """Test a RateLimiter admits requests through the Redis backend"""
+    store = {}
+    server = await asyncio.start_server(lambda r, w: _serve_redis(store, r, w), '127.0.0.1', 0)
+    port = server.sockets[0].getsockname()[1]
+    try:
+        backend = CountingBackend(RedisQuotaBackend(f'redis://127.0.0.1:{port}', window=60))
+        limiter = RateLimiter(rate=10, backend=backend, lease_size=25)
+        for _ in range(25):
+            await limiter.acquire()
+        assert backend.calls == 1
+        await backend.inner.aclose()
+    finally:
+        server.close()
+        await server.wait_closed()
@@ -0,0 +1,97 @@
+"""
+Priority scheduler tests for requests-async (offline, using httpx.MockTransport)
+"""
+
+import asyncio
+import httpx
+import pytest
+import requests_async
+
+
+@pytest.mark.asyncio
+async def test_priority_order():
+    """Test queued requests are dispatched highest priority first"""
+    gate = asyncio.Event()
+    order = []
+
+    async def handler(request):
+        name = request.url.path.strip('/')
+        order.append(name)
+        if name == 'blocker':
+            await gate.wait()
+        return httpx.Response(200)
+
+    async with requests_async.AsyncSession(
+        transport=httpx.MockTransport(handler), max_concurrency=1
+    ) as session:
+        blocker = asyncio.ensure_future(session.get('https://api.test/blocker'))
+        await asyncio.sleep(0)
+        background = asyncio.ensure_future(session.get('https://api.test/background', priority=-1))
+        interactive = asyncio.ensure_future(session.get('https://api.test/interactive', priority=10))
+        await asyncio.sleep(0)
+        stats = session.queue_stats()
+        assert stats['active'] == 1
+        assert stats['queued_by_priority'] == {-1: 1, 10: 1}
+        gate.set()
+        await asyncio.gather(blocker, background, interactive)
+
+    assert order == ['blocker', 'interactive', 'background']
+
+
+@pytest.mark.asyncio
+async def test_deadline_drops_queued_request():
+    """Test expired requests are dropped before dispatch"""
+    gate = asyncio.Event()
+    sent = []
+
+    async def handler(request):
+        sent.append(request.url.path)
+        await gate.wait()
+        return httpx.Response(200)
+
+    async with requests_async.AsyncSession(
+        transport=httpx.MockTransport(handler), max_concurrency=1
+    ) as session:
+        blocker = asyncio.ensure_future(session.get('https://api.test/blocker'))
+        await asyncio.sleep(0)
+        with pytest.raises(requests_async.DeadlineExceeded):
+            await session.get('https://api.test/late', deadline=0.01)
+        gate.set()
+        await blocker
+        assert session.queue_stats()['expired'] == 1
+
+    assert sent == ['/blocker']
+
+
+@pytest.mark.asyncio
+async def test_no_scheduler_by_default():
+    """Test sessions without max_concurrency have no queue"""
+    async with requests_async.AsyncSession(
+        transport=httpx.MockTransport(lambda request: httpx.Response(204))
+    ) as session:
+        response = await session.get('https://api.test/', priority=5)
+        assert response.status_code == 204
+        assert session.queue_stats() is None
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('max_concurrency', [None, 5])
+async def test_deadline_covers_rate_limit_wait(max_concurrency):
+    """Test requests whose deadline passes while rate limited are never sent"""
+    sent = []
+
+    def handler(request):
+        sent.append(request.url.path)
+        return httpx.Response(200)
+
+    async with requests_async.AsyncSession(
+        transport=httpx.MockTransport(handler), max_concurrency=max_concurrency,
+        rate_limit=requests_async.RateLimiter(10, burst=1),
+    ) as session:
+        results = await asyncio.gather(
+            *(session.get(f'https://api.test/{i}', deadline=0.05) for i in range(4)),
+            return_exceptions=True,
+        )
+
+    assert sent == ['/0']
+    assert all(isinstance(r, requests_async.DeadlineExceeded) for r in results[1:])
@@ -0,0 +1,150 @@
+"""
+Result sink tests for requests-async (offline, using httpx.MockTransport)
+"""
+
+import asyncio
+import json
+
+import httpx
+import pytest
+import requests_async
+from requests_async.sinks import Checkpoint
+
+
+def _handler(request):
+    path = request.url.path
+    if path == '/down':
+        raise httpx.ConnectError("refused", request=request)
+    if path == '/binary':
+        return httpx.Response(200, content=b'\xff\x00\xfe')
+    if path == '/busy':
+        return httpx.Response(503)
+    if path == '/throttled':
+        return httpx.Response(429)
+    if path == '/missing':
+        return httpx.Response(404)
+    return httpx.Response(200, text=f'body of {path}', headers={'Content-Type': 'text/plain'})
+
+
+def _session():
+    return requests_async.AsyncSession(transport=httpx.MockTransport(_handler))
+
+
+def _read_jsonl(path):
+    with open(path, encoding='utf-8') as f:
+        return [json.loads(line) for line in f]
+
+
+@pytest.mark.asyncio
+async def test_jsonl_sink(tmp_path):
+    """Test results stream to JSONL in batches, including errors and binary bodies"""
+    out = tmp_path / 'out.jsonl'
+    urls = [f'https://api.test/{i}' for i in range(25)] + [
+        'https://api.test/down', 'https://api.test/binary']
+    async with _session() as session:
+        stats = await session.fetch_many(urls, requests_async.JSONLSink(str(out)),
+                                         concurrency=4, batch_size=10)
+
+    assert stats == {'fetched': 26, 'errors': 1, 'skipped': 0, 'written': 27}
+    records = {r['url']: r for r in _read_jsonl(out)}
+    assert records['https://api.test/3']['body'] == 'body of /3'
+    assert records['https://api.test/3']['headers'] == {'content-type': 'text/plain'}
+    assert records['https://api.test/down']['error'].startswith('ConnectError')
+    assert records['https://api.test/binary']['body_base64'] == '/wD+'
+
+
+@pytest.mark.asyncio
+async def test_checkpoint_resume(tmp_path):
+    """Test a rerun skips completed URLs and retries failed and retryable ones"""
+    out, ckpt = tmp_path / 'out.jsonl', tmp_path / 'run.ckpt'
+    urls = [f'https://api.test/{name}' for name in ('a', 'down', 'busy', 'throttled', 'missing', 'b')]
+    async with _session() as session:
+        await session.fetch_many(urls, requests_async.JSONLSink(str(out)), checkpoint=str(ckpt))
+        stats = await session.fetch_many(urls + ['https://api.test/c'],
+                                         requests_async.JSONLSink(str(out)),
+                                         checkpoint=str(ckpt))
+
+    assert stats['skipped'] == 3
+    assert stats['fetched'] == 3 and stats['errors'] == 1
+    assert sorted(ckpt.read_text().split()) == [
+        'https://api.test/a', 'https://api.test/b', 'https://api.test/c', 'https://api.test/missing']
+
+
+@pytest.mark.asyncio
+async def test_checkpoint_retry_statuses(tmp_path):
+    """Test a Checkpoint with custom retry_statuses records the rest as done"""
+    ckpt = tmp_path / 'run.ckpt'
+    urls = ['https://api.test/busy', 'https://api.test/throttled']
+    async with _session() as session:
+        await session.fetch_many(urls, requests_async.JSONLSink(str(tmp_path / 'out.jsonl')),
+                                 checkpoint=Checkpoint(str(ckpt), retry_statuses={429}))
+
+    assert ckpt.read_text().split() == ['https://api.test/busy']
+
+
+@pytest.mark.asyncio
+async def test_directory_sink(tmp_path):
+    """Test bodies land in separate files indexed by index.jsonl"""
+    async with _session() as session:
+        await session.fetch_many(['https://api.test/x', 'https://api.test/down'],
+                                 requests_async.DirectorySink(str(tmp_path / 'bodies'), '.txt'))
+
+    index = _read_jsonl(tmp_path / 'bodies' / 'index.jsonl')
+    ok = next(r for r in index if 'file' in r)
+    assert ok['file'].endswith('.txt')
+    assert (tmp_path / 'bodies' / ok['file']).read_bytes() == b'body of /x'
+    assert any('error' in r for r in index)
+
+
+class SlowSink(requests_async.ResultSink):
+    def __init__(self):
+        self.batches = []
+
+    def write_batch(self, results):
+        import time
+        time.sleep(0.02)
+        self.batches.append(len(results))
+
+
+@pytest.mark.asyncio
+async def test_backpressure_bounds_buffer():
+    """Test fetchers wait for a slow sink instead of buffering everything"""
+    sink = SlowSink()
+    async with _session() as session:
+        stats = await session.fetch_many((f'https://api.test/{i}' for i in range(100)), sink,
+                                         concurrency=10, batch_size=5, buffer_size=5)
+    assert stats['written'] == 100
+    assert max(sink.batches) <= 5
+
+
+class BrokenSink(requests_async.ResultSink):
+    def write_batch(self, results):
+        raise OSError("disk full")
+
+
+@pytest.mark.asyncio
+async def test_sink_error_stops_fetching():
+    """Test a failing sink aborts the run instead of hanging"""
+    async with _session() as session:
+        with pytest.raises(OSError, match='disk full'):
+            await asyncio.wait_for(
+                session.fetch_many((f'https://api.test/{i}' for i in range(1000)), BrokenSink(),
+                                   batch_size=2, buffer_size=2),
+                timeout=10,
+            )
+
+
+def test_parquet_sink(tmp_path):
+    """Test the Parquet sink writes a readable table"""
+    pq = pytest.importorskip('pyarrow.parquet')
+    path = str(tmp_path / 'out.parquet')
+
+    async def run():
+        async with _session() as session:
+            await session.fetch_many(['https://api.test/p', 'https://api.test/down'],
+                                     requests_async.ParquetSink(path))
+
+    asyncio.run(run())
+    table = pq.read_table(path).to_pydict()
+    assert sorted(table['url']) == ['https://api.test/down', 'https://api.test/p']
+    assert b'body of /p' in table['body']
@@ -0,0 +1,82 @@
+"""
+Synchronous facade tests for requests-async (offline, using httpx.MockTransport)
+"""
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+import pytest
+import requests_async
+
+
+def _handler(request):
+    if request.url.path == '/fail':
+        raise httpx.ConnectError("boom", request=request)
+    return httpx.Response(200, json={'path': request.url.path,
+                                     'thread': threading.current_thread().name})
+
+
+def test_sync_session_basic():
+    """Test sync calls run on the background loop thread"""
+    with requests_async.sync.Session(transport=httpx.MockTransport(_handler)) as session:
+        response = session.get('https://api.test/hello')
+        assert response.status_code == 200
+        assert response.json() == {'path': '/hello', 'thread': 'requests-async-sync'}
+
+
+def test_sync_session_many_threads():
+    """Test one session is safely shared by many caller threads"""
+    with requests_async.sync.Session(transport=httpx.MockTransport(_handler)) as session:
+        with ThreadPoolExecutor(8) as pool:
+            paths = list(pool.map(lambda i: session.get(f'https://api.test/{i}').json()['path'],
+                                  range(32)))
+    assert paths == [f'/{i}' for i in range(32)]
+
+
+def test_sync_session_map():
+    """Test map returns responses in order and can collect exceptions"""
+    with requests_async.sync.Session(transport=httpx.MockTransport(_handler)) as session:
+        results = session.map('GET', ['https://api.test/a', 'https://api.test/fail',
+                                      'https://api.test/b'], return_exceptions=True)
+        assert results[0].json()['path'] == '/a'
+        assert isinstance(results[1], httpx.ConnectError)
+        assert results[2].json()['path'] == '/b'
+
+        with pytest.raises(httpx.ConnectError):
+            session.map('GET', ['https://api.test/fail'])
+
+
+def test_sync_session_map_concurrency():
+    """Test map bounds requests in flight and consumes URLs lazily"""
+    inflight = peak = done = 0
+
+    async def handler(request):
+        nonlocal inflight, peak, done
+        inflight += 1
+        peak = max(peak, inflight)
+        await asyncio.sleep(0.001)
+        inflight -= 1
+        done += 1
+        return httpx.Response(200, json={'path': request.url.path})
+
+    def urls():
+        for i in range(40):
+            # Only the next URL for a free worker is pulled from the iterator
+            assert i - done <= 4
+            yield f'https://api.test/{i}'
+
+    with requests_async.sync.Session(transport=httpx.MockTransport(handler)) as session:
+        results = session.map('GET', urls(), concurrency=4)
+    assert [r.json()['path'] for r in results] == [f'/{i}' for i in range(40)]
+    assert peak == 4
+
+
+def test_sync_session_closed():
+    """Test a closed session rejects new calls"""
+    session = requests_async.sync.Session(transport=httpx.MockTransport(_handler))
+    session.close()
+    session.close()
+    with pytest.raises(RuntimeError):
+        session.get('https://api.test/')
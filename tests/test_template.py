@@ -0,0 +1,99 @@
+"""
+Request template tests for requests-async (offline, using httpx.MockTransport)
+"""
+
+import json
+
+import httpx
+import pytest
+import requests_async
+
+
+def _echo(request):
+    return httpx.Response(200, json={
+        'method': request.method,
+        'url': str(request.url),
+        'headers': dict(request.headers),
+        'body': request.content.decode(),
+        'timeout': request.extensions['timeout'],
+    })
+
+
+def _session(**kwargs):
+    return requests_async.AsyncSession(transport=httpx.MockTransport(_echo), **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_template_merges_session_defaults():
+    """Test base URL, session headers/params and template values are pre-merged"""
+    async with _session(base_url='https://api.test/v1', headers={'X-Session': 's'},
+                        params={'key': 'k'}, timeout=7.0) as session:
+        template = session.prepare('get', '/users/{user_id}', headers={'Accept': 'json'},
+                                   params={'fields': 'name'})
+        data = (await template.send({'user_id': 'a b/c'}, params={'page': 2})).json()
+
+    assert data['method'] == 'GET'
+    assert data['url'] == 'https://api.test/v1/users/a%20b%2Fc?key=k&fields=name&page=2'
+    assert data['headers']['x-session'] == 's'
+    assert data['headers']['accept'] == 'json'
+    assert data['timeout']['read'] == 7.0
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('base_url, path', [
+    ('', 'https://other.test/x'),
+    ('https://api.test', '/users'),
+    ('https://api.test/v1/', 'users'),
+    ('https://api.test/v1', 'https://other.test/abs'),
+])
+async def test_template_matches_build_request(base_url, path):
+    """Test templates build the same request as httpx's own merging"""
+    async with _session(base_url=base_url, headers={'X-Session': 's'},
+                        params={'key': 'k'}) as session:
+        template = session.prepare('GET', path, headers={'Accept': 'json'}, params={'q': 'v'})
+        expected = session._client.build_request('GET', path, headers={'Accept': 'json'},
+                                                 params={'q': 'v'})
+        request = template.build()
+    assert request.url == expected.url
+    assert list(request.headers.multi_items()) == list(expected.headers.multi_items())
+
+
+@pytest.mark.asyncio
+async def test_static_template_reuse_and_body():
+    """Test a template without fields is reused with per-call bodies and headers"""
+    async with _session() as session:
+        template = session.prepare('POST', 'https://api.test/items', timeout=3.0)
+        first = (await template.send(json={'n': 1}, headers={'X-Call': '1'})).json()
+        second = (await template.send(content=b'raw')).json()
+
+    assert first['url'] == second['url'] == 'https://api.test/items'
+    assert json.loads(first['body']) == {'n': 1}
+    assert first['headers']['x-call'] == '1'
+    assert 'x-call' not in second['headers']
+    assert second['body'] == 'raw'
+    assert second['timeout']['connect'] == 3.0
+
+
+@pytest.mark.asyncio
+async def test_template_uses_scheduler_and_cookies():
+    """Test templates go through the session queue and send session cookies"""
+    async with _session(max_concurrency=2, cookies={'sid': 'abc'}) as session:
+        template = session.prepare('GET', 'https://api.test/me')
+        data = (await template.send(priority=5)).json()
+        assert session.queue_stats()['dispatched'] == 1
+    assert data['headers']['cookie'] == 'sid=abc'
+
+
+@pytest.mark.asyncio
+async def test_template_missing_field():
+    """Test missing path fields are reported"""
+    async with _session() as session:
+        template = session.prepare('GET', '/users/{user_id}/posts/{post_id}')
+        with pytest.raises(KeyError, match='post_id'):
+            template.build({'user_id': 1})
+
+
+def test_prepare_requires_open_session():
+    """Test templates need an initialized session"""
+    with pytest.raises(RuntimeError):
+        requests_async.AsyncSession().prepare('GET', 'https://api.test/')
@@ -0,0 +1,81 @@
+"""
+SSL context cache tests for requests-async (offline, using a local TLS server)
+"""
+
+import asyncio
+import shutil
+import ssl
+import subprocess
+
+import pytest
+import requests_async
+from requests_async.tls import ResumingSSLContext
+
+RESPONSE = b"HTTP/1.1 200 OK\r\nContent-Length: 2\r\nConnection: close\r\n\r\nok"
+
+
+def test_contexts_are_shared():
+    """Test sessions with equal settings share one context"""
+    first = requests_async.AsyncSession()._client_kwargs['verify']
+    second = requests_async.AsyncSession(timeout=5)._client_kwargs['verify']
+    unverified = requests_async.AsyncSession(verify=False)._client_kwargs['verify']
+    assert isinstance(first, ResumingSSLContext)
+    assert first is second
+    assert unverified is not first
+    assert unverified.verify_mode == ssl.CERT_NONE
+
+
+def test_custom_context_passthrough():
+    """Test a caller-supplied SSLContext is used as-is"""
+    context = ssl.create_default_context()
+    assert requests_async.AsyncSession(verify=context)._client_kwargs['verify'] is context
+
+
+def test_clear_cache():
+    """Test clearing the cache builds fresh contexts"""
+    before = requests_async.get_ssl_context()
+    requests_async.clear_ssl_context_cache()
+    assert requests_async.get_ssl_context() is not before
+
+
+@pytest.fixture
+def certificate(tmp_path):
+    if shutil.which('openssl') is None:
+        pytest.skip("openssl command not available")
+    cert, key = tmp_path / 'cert.pem', tmp_path / 'key.pem'
+    subprocess.run(
+        ['openssl', 'req', '-x509', '-newkey', 'rsa:2048', '-nodes', '-days', '1',
+         '-subj', '/CN=localhost', '-addext', 'subjectAltName=DNS:localhost',
+         '-keyout', str(key), '-out', str(cert)],
+        check=True, capture_output=True,
+    )
+    return str(cert), str(key)
+
+
+@pytest.mark.asyncio
+async def test_tls_session_resumption(certificate):
+    """Test a new session to the same host resumes the previous TLS session"""
+    cert, key = certificate
+    server_context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+    server_context.load_cert_chain(cert, key)
+    reused = []
+
+    async def handle(reader, writer):
+        reused.append(writer.get_extra_info('ssl_object').session_reused)
+        await reader.readuntil(b"\r\n\r\n")
+        writer.write(RESPONSE)
+        await writer.drain()
+        writer.close()
+
+    server = await asyncio.start_server(handle, '127.0.0.1', 0, ssl=server_context)
+    port = server.sockets[0].getsockname()[1]
+    try:
+        for _ in range(3):
+            async with requests_async.AsyncSession(verify=cert) as session:
+                response = await session.get(f'https://localhost:{port}/')
+                assert response.text == 'ok'
+    finally:
+        server.close()
+        await server.wait_closed()
+
+    assert reused == [False, True, True]